@@ -1,20 +1,33 @@
 """Fetch data from various packages (yfinance, ccxt, etc.)."""
 
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from ..cache import DiskCache
 from .models import PriceDataFrame, PricePoint
 
 logger = logging.getLogger(__name__)
 
+# Longest bar history kept per (symbol, interval) in the on-disk bar store
+MAX_STORED_BARS = 5000
+
 
 class PackageDataFetcher:
     """Fetch cryptocurrency and stock data from various sources."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize fetcher.
+
+        Args:
+            cache_dir: Directory for the on-disk bar store. When set, past bars
+                are kept between runs and only the trailing ones are refetched.
+        """
         self.yfinance_available = self._check_yfinance()
         self.ccxt_available = self._check_ccxt()
+        self._bar_store = DiskCache(cache_dir) if cache_dir else None
 
     def _check_yfinance(self) -> bool:
         """Check if yfinance is available."""
@@ -38,6 +51,12 @@ class PackageDataFetcher:
         self, symbol: str, days: int = 30, interval: str = "1d"
     ) -> Optional[PriceDataFrame]:
         """Fetch data for symbol."""
+        if self._bar_store is not None:
+            return self._fetch_incremental(symbol, days, interval)
+        return self._fetch_source(symbol, days, interval)
+
+    def _fetch_source(self, symbol: str, days: int, interval: str) -> Optional[PriceDataFrame]:
+        """Fetch data from the first available provider."""
         if self.yfinance_available:
             return self._fetch_yfinance(symbol, days, interval)
         elif self.ccxt_available:
@@ -62,6 +81,52 @@ class PackageDataFetcher:
         """
         return self.fetch_data(symbol, days, interval)
 
+    def _fetch_incremental(self, symbol: str, days: int, interval: str) -> Optional[PriceDataFrame]:
+        """
+        Fetch data through the on-disk bar store.
+
+        Bars older than the latest stored one never change, so when the store
+        already reaches back far enough only the days since its last bar are
+        requested from the provider. The refetched tail replaces any stored
+        bars it overlaps, which refreshes the still-forming candle.
+        """
+        key = f"bars_{symbol.upper()}_{interval}"
+        try:
+            stored = self._bar_store.get(key)
+        except Exception as e:
+            logger.warning(f"Bar store read failed for {key}: {e}")
+            stored = None
+
+        now = time.time()
+        cutoff = now - days * 86400
+        bars = stored["bars"] if stored else []
+
+        # Allow one day of slack: the provider's first bar can start after the cutoff
+        if bars and bars[0].timestamp.timestamp() <= cutoff + 86400:
+            tail_days = int((now - bars[-1].timestamp.timestamp()) // 86400) + 1
+            fresh = self._fetch_source(symbol, min(tail_days, days), interval)
+        else:
+            fresh = self._fetch_source(symbol, days, interval)
+            bars = []
+
+        if fresh is not None and fresh.data:
+            first_new = fresh.data[0].timestamp.timestamp()
+            bars = [p for p in bars if p.timestamp.timestamp() < first_new] + fresh.data
+            bars = bars[-MAX_STORED_BARS:]
+            resolved = fresh.symbol
+            try:
+                self._bar_store.set(key, {"symbol": resolved, "bars": bars}, ttl=0)
+            except Exception as e:
+                logger.warning(f"Bar store write failed for {key}: {e}")
+        elif bars:
+            logger.warning(f"Refresh failed for {symbol}; serving stored bars")
+            resolved = stored["symbol"]
+        else:
+            return None
+
+        window = [p for p in bars if p.timestamp.timestamp() >= cutoff - 86400]
+        return PriceDataFrame(window, symbol=resolved, timeframe=interval)
+
     def _fetch_yfinance(self, symbol: str, days: int, interval: str) -> Optional[PriceDataFrame]:
         """Fetch data using yfinance."""
         try:
@@ -5,28 +5,337 @@ Interactive matplotlib-based charts with pattern visualization
 Made with ❤️ by the MeridianAlgo Algorithmic Research Team (Quantum Meridian)
 """
 
+import bisect
+import functools
 import logging
+import math
 import os
+import pickle
+import re
 import sys
 import threading
+import time
 import tkinter as tk
+from concurrent.futures import Future
 from datetime import datetime
 from tkinter import filedialog, messagebox, ttk
 
 import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba, to_rgba_array
 from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
+from matplotlib.ticker import FuncFormatter
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from cryptvault.core.analyzer import PatternAnalyzer
+from cryptvault.data.models.package_fetcher import PackageDataFetcher
 
 logger = logging.getLogger(__name__)
 
+# Pattern color classes in priority order. Each alternative is an anchored
+# lookahead, so the first class that occurs anywhere in the name wins and a
+# single match replaces the chain of substring tests.
+_COLOR_RE = re.compile(
+    r"^(?:(?=.*(?P<divergence>divergence))"
+    r"|(?=.*(?P<channel>channel))"
+    r"|(?=.*(?P<wedge>wedge))"
+    r"|(?=.*(?P<flag>flag|pennant))"
+    r"|(?=.*(?P<triangle>triangle))"
+    r"|(?=.*(?P<harmonic>gartley|butterfly|\bbat\b|crab|abcd|cypher))"
+    r"|(?=.*(?P<bullish>bull))"
+    r"|(?=.*(?P<bearish>bear)))",
+    re.IGNORECASE,
+)
+
+# Drawing kinds in dispatch priority order, in the same anchored-lookahead
+# form as _COLOR_RE: the first alternative whose keyword occurs wins, so one
+# match classifies a pattern name. Names matching none are drawn generically.
+_KIND_RE = re.compile(
+    r"^(?:(?=.*(?P<rectangle>rectangle))"
+    r"|(?=.*(?P<expanding_triangle>expanding triangle))"
+    r"|(?=.*(?P<triangle>triangle))"
+    r"|(?=.*(?P<channel>channel))"
+    r"|(?=.*(?P<wedge>wedge))"
+    r"|(?=.*(?P<flag>flag|pennant))"
+    r"|(?!.*inverse)(?=.*head)(?=.*(?P<head_shoulders>shoulders?))"
+    r"|(?=.*(?P<divergence>divergence)))",
+    re.IGNORECASE,
+)
+
+# Filter toggle (BooleanVar attribute) that hides each drawing kind
+_KIND_FILTERS = {
+    "rectangle": "show_rectangles",
+    "expanding_triangle": "show_triangles",
+    "triangle": "show_triangles",
+    "channel": "show_channels",
+    "wedge": "show_wedges",
+    "flag": "show_flags",
+    "divergence": "show_divergence",
+}
+
+# Kinds whose drawers share the (x, highs, lows, color, ptype) signature.
+# "divergence" has no dedicated shape: it only keys its filter toggle and is
+# drawn by _draw_default_pattern.
+_SHAPE_DRAWERS = {
+    "triangle": "_draw_triangle",
+    "channel": "_draw_channel",
+    "wedge": "_draw_wedge",
+    "flag": "_draw_flag",
+}
+
+# Pattern timestamps: "YYYY-MM-DD", optionally followed by " HH:MM:SS" or
+# "THH:MM:SS", a fractional second and a trailing "Z". One match replaces a
+# ladder of strptime attempts that raise on every format that does not fit.
+_DT_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?Z?)?$")
+
+# Scatter styles for pattern markers; markers are queued per style while the
+# patterns are walked and emitted with one scatter call each.
+_MARKER_STYLES = {
+    "o": {"s": 80, "alpha": 0.9, "edgecolors": "white", "linewidth": 2, "zorder": 7},
+    "*": {"s": 120, "alpha": 0.9, "edgecolors": "#ffffff", "linewidth": 2, "zorder": 10},
+    "X": {"s": 100, "alpha": 0.8, "edgecolors": "white", "linewidth": 2},
+}
+
+
+# Longest series drawn bar-for-bar; longer histories are bucketed into OHLC
+# aggregates, since more candles than this cannot be resolved on screen.
+_MAX_CHART_BARS = 500
+
+# Seconds a fetched (symbol, days, interval) series is reused across analyses
+_FETCH_TTL = 60.0
+
+# Fetched series kept at most; the oldest insertion is evicted first
+_FETCH_CACHE_SIZE = 32
+
+# On-disk store for chart bars, so reopening a symbol only refetches recent days
+_BAR_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cryptvault", "bars")
+
+# Pattern list glyphs, first substring match on the lower-cased type wins
+_LIST_SYMBOLS = (
+    ("rectangle", "📊"),
+    ("triangle", "📐"),
+    ("channel", "📈"),
+    ("wedge", "📉"),
+    ("flag", "🚩"),
+    ("pennant", "🎯"),
+    ("divergence", "⚡"),
+    ("head and shoulders", "👤"),
+    ("double top", "⛰️"),
+    ("double bottom", "🏔️"),
+)
+_DIRECTION_DOTS = {"bullish": "🟢", "bearish": "🔴", "neutral": "🟡"}
+
+# Candle and volume colours as RGBA rows for the persistent collections
+_UP_RGBA = np.array(to_rgba("#00ff88"))
+_DOWN_RGBA = np.array(to_rgba("#ff4444"))
+_FLAT_RGBA = np.array(to_rgba("#666666"))
+
+# Confidence bars for the pattern list, indexed by whole tens of percent
+_CONF_BARS = tuple("█" * n + "░" * (10 - n) for n in range(11))
+
+
+def _downsample_ohlc(dates, opens, highs, lows, closes, volumes, max_bars=_MAX_CHART_BARS):
+    """Aggregate consecutive bars so that at most ``max_bars`` candles remain.
+
+    Each bucket keeps the first open and timestamp, the highest high, the lowest
+    low, the last close and the summed volume. A short final bucket is kept so
+    the most recent bars are never dropped. Price and volume columns come
+    back as float64 arrays.
+    """
+    n = len(closes)
+    if n <= max_bars:
+        return dates, opens, highs, lows, closes, volumes
+
+    k = math.ceil(n / max_bars)
+    starts = np.arange(0, n, k)
+    ends = np.minimum(starts + k, n) - 1
+    return (
+        [dates[i] for i in starts],
+        np.asarray(opens, dtype=np.float64)[starts],
+        np.maximum.reduceat(np.asarray(highs, dtype=np.float64), starts),
+        np.minimum.reduceat(np.asarray(lows, dtype=np.float64), starts),
+        np.asarray(closes, dtype=np.float64)[ends],
+        np.add.reduceat(np.asarray(volumes, dtype=np.float64), starts),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _fallback_bbox(color):
+    """Annotation box for a fallback marker label; one shared dict per colour.
+
+    Text.set_bbox copies its argument, so annotations may share these.
+    """
+    return {"boxstyle": "round,pad=0.3", "alpha": 0.3, "facecolor": color, "edgecolor": color}
+
+
+@functools.lru_cache(maxsize=64)
+def _label_bbox(color):
+    """Annotation box for a generic pattern label; one shared dict per colour."""
+    return {"boxstyle": "round,pad=0.4", "alpha": 0.8, "edgecolor": "white", "facecolor": color}
+
+
+@functools.lru_cache(maxsize=256)
+def _list_symbol(ptype):
+    """Pattern-list emoji for a pattern name: first ``_LIST_SYMBOLS`` keyword found."""
+    lowered = ptype.lower()
+    return next((emoji for key, emoji in _LIST_SYMBOLS if key in lowered), "◆")
+
+
+@functools.lru_cache(maxsize=256)
+def _pattern_kind(ptype):
+    """Drawing kind for a pattern name (a ``_KIND_RE`` group), or ``"default"``."""
+    match = _KIND_RE.match(ptype)
+    return match.lastgroup if match and match.lastgroup else "default"
+
+
+def _fast_parse_dt(text):
+    """Parse a naive ISO-style pattern timestamp; None if it does not fit.
+
+    The C-level ``datetime.fromisoformat`` handles the common shapes; the
+    ``_DT_RE`` parse only sees what it rejects, such as a trailing ``Z`` on
+    older Pythons or a fraction that is not 3 or 6 digits long.
+    """
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        parsed = None
+    if parsed is not None and parsed.tzinfo is None:
+        return parsed
+    m = _DT_RE.match(text)
+    if not m:
+        return None
+    year, month, day, hour, minute, second, frac = m.groups(default="0")
+    try:
+        return datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second),
+            int((frac + "000000")[:6]),
+        )
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _epoch_from_string(text):
+    """Epoch seconds for a pattern timestamp string, or None if it does not parse.
+
+    The same pattern times come back on every re-analysis, so results are
+    memoised; the LRU bound keeps long sessions from growing the cache.
+    """
+    parsed = _fast_parse_dt(text)
+    return None if parsed is None else parsed.timestamp()
+
+
+def _to_timestamp(value):
+    """Seconds since the epoch for a datetime or a plain number, else None."""
+    if hasattr(value, "timestamp"):
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return None
+
+
+def _find_hns_points(highs):
+    """Locate head-and-shoulders anchor bars in a window of highs.
+
+    Returns ``(left_peak, head, right_peak, left_trough, right_trough)`` as
+    indices into ``highs``; every index is -1 when the window is too short or
+    the head sits within two bars of either edge. Troughs are the lowest highs
+    between each shoulder and the head, which is where the neckline runs.
+    Compiled with numba when it is installed.
+    """
+    n = highs.shape[0]
+    if n < 5:
+        return -1, -1, -1, -1, -1
+    head = np.argmax(highs)
+    if head < 2 or head >= n - 2:
+        return -1, -1, -1, -1, -1
+    left_peak = np.argmax(highs[:head])
+    right_peak = head + 1 + np.argmax(highs[head + 1 :])
+    left_trough = left_peak + np.argmin(highs[left_peak:head])
+    right_trough = head + 1 + np.argmin(highs[head + 1 : right_peak + 1])
+    return left_peak, head, right_peak, left_trough, right_trough
+
+
+if NUMBA_AVAILABLE:
+    _find_hns_points = njit("UniTuple(int64, 5)(float64[:])", cache=True)(_find_hns_points)
+
+
+def _nearest_index(date_ts, target):
+    """Index of the bar time in sorted, non-empty ``date_ts`` closest to ``target``.
+
+    Binary search, then step back when the previous bar is at least as close.
+    ``date_ts`` is a float list searched with bisect, or a float64 array for
+    the numba build below.
+    """
+    idx = bisect.bisect_left(date_ts, target)
+    if idx >= len(date_ts):
+        return len(date_ts) - 1
+    if idx > 0 and target - date_ts[idx - 1] <= date_ts[idx] - target:
+        return idx - 1
+    return idx
+
+
+if NUMBA_AVAILABLE:
+
+    @njit("int64(float64[:], float64)", cache=True)
+    def _nearest_index(date_ts, target):  # noqa: F811 - compiled twin of the above
+        idx = np.searchsorted(date_ts, target)
+        if idx >= date_ts.shape[0]:
+            return date_ts.shape[0] - 1
+        if idx > 0 and target - date_ts[idx - 1] <= date_ts[idx] - target:
+            return idx - 1
+        return idx
+
+
+def _format_volume(x, pos):
+    """Volume axis tick label (module level so the figure stays picklable)."""
+    return f"{x/1e6:.1f}M" if x >= 1e6 else f"{x/1e3:.0f}K"
+
+
+def _parse_confidence(pattern):
+    """Return a pattern's confidence as a 0-1 float."""
+    raw = pattern.get("confidence_raw")
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    try:
+        return float(str(pattern.get("confidence", "0")).rstrip("%")) / 100
+    except ValueError:
+        return 0.0
+
+
+def _spawn(fn, *args, **kwargs):
+    """Run ``fn(*args, **kwargs)`` on a daemon thread and return its Future.
+
+    Pool workers are joined at interpreter exit, so a fetch blocked on the
+    network would keep the process alive after the window closes; a daemon
+    thread is simply abandoned.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, name="cryptvault-desktop", daemon=True).start()
+    return future
+
 
 class CryptVaultDesktopCharts:
     """Desktop chart application with interactive pattern visualization."""
@@ -49,13 +358,14 @@ class CryptVaultDesktopCharts:
         except:
             pass
 
-        # Initialize analyzer
+        # Initialize analyzer and the fetcher used for chart bars
         self.analyzer = PatternAnalyzer()
+        self.data_fetcher = PackageDataFetcher(cache_dir=_BAR_CACHE_DIR)
         # Increase pattern sensitivity and quality by default for desktop viz
         try:
             # Initialize variables to prevent NameError
             self._display_patterns = []
-            self._pattern_ranges = []
+            self._pattern_ranges = np.empty((0, 2), dtype=np.int32)
             self._current_symbol = "BTC"
             self._current_days = 30
             self._current_interval = "1d"
@@ -75,10 +385,34 @@ class CryptVaultDesktopCharts:
         self.ax_price = None
         self.ax_vol = None
         self.canvas = None
-        self._pattern_ranges = []  # list of (start_idx, end_idx)
+        self._pattern_ranges = np.empty((0, 2), dtype=np.int32)  # (start, end) bar per pattern
+        self._pattern_markers = {}  # marker -> ([x], [y], [color]) pending scatter
+        self._pattern_segments = {}  # (linestyle, width, alpha) -> ([x0], [y0], [x1], [y1], [color])
+        self._pattern_bands = []  # (x, highs, lows, color) pending default-pattern bands
+        self._pattern_annots = []  # pattern annotations on the price axis
+        # Bound shape drawers by kind, resolved once rather than per pattern
+        self._draw_dispatch = {kind: getattr(self, name) for kind, name in _SHAPE_DRAWERS.items()}
+        self._chart_series = ()  # (dates, x, opens, highs, lows, closes) currently drawn
+        self._chart_date_ts = None  # bar times in seconds for the drawn dates, built lazily
+        self._chart_dates_ordered = True  # whether _chart_date_ts is sorted
+        self._pattern_index_cache = {}  # id(pattern) -> (s_idx, e_idx) for the drawn bars
+        self._color_cache = {}  # pattern type -> resolved pattern_colors entry
+        self._overlay_artists = []  # animated pattern artists blitted over self._bg
+        self._bg = None  # cached candles/volume background for blitting
+        self._last_bg_sig = None  # _background_signature of the bars in self._bg
+        self._filter_job = None  # pending root.after id for a filter redraw
+        self._select_job = None  # pending root.after id for a pattern-select redraw
+        self._analyze_job = None  # pending root.after id for a keyboard-triggered analysis
+        self._hidden_kinds = frozenset()  # pattern kinds switched off by the filter toggles
         self._current_days = 60
         self._current_interval = "1d"
         self._display_patterns = []
+        # Analyses run one at a time on a daemon thread; each gets an id so a
+        # result that is no longer the latest request is never drawn
+        self._analysis_id = 0
+        self._pending_analysis = None  # analysis future in flight, if any
+        self._restart_requested = None  # latest (symbol, days, interval) queued behind it
+        self._data_cache = {}  # (symbol, days, interval) -> (fetched_at, raw_data, series)
 
         # Enhanced pattern colors with better contrast
         self.pattern_colors = {
@@ -122,6 +456,7 @@ class CryptVaultDesktopCharts:
         }
 
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         # Auto-run first analysis for a better first impression
         self.root.after(100, self.analyze_symbol)
 
@@ -206,7 +541,11 @@ class CryptVaultDesktopCharts:
         chart_frame.pack(fill=tk.BOTH, expand=True)
 
         # Create enhanced matplotlib figure with modern styling
-        self.fig = Figure(figsize=(14, 10), facecolor="#0a0e13", edgecolor="none")
+        # Constrained layout re-fits tick labels as part of each draw, so updates
+        # need no separate tight_layout pass
+        self.fig = Figure(
+            figsize=(14, 10), facecolor="#0a0e13", edgecolor="none", layout="constrained"
+        )
         self.fig.patch.set_facecolor("#0a0e13")
         gs = self.fig.add_gridspec(3, 1, height_ratios=[3, 1, 0.3], hspace=0.1)
         self.ax_price = self.fig.add_subplot(gs[0])
@@ -220,18 +559,95 @@ class CryptVaultDesktopCharts:
         for spine in self.ax_info.spines.values():
             spine.set_visible(False)
 
-        # Modern dark theme styling
+        # Modern dark theme styling, applied once; updates only swap data artists
         for ax in (self.ax_price, self.ax_vol):
-            ax.tick_params(colors="#d0d4dc")
+            ax.set_facecolor("#0f1419")
+            ax.tick_params(colors="#e6e8eb", labelsize=10)
+            ax.grid(True, color="#1e2329", alpha=0.4, linewidth=0.5, linestyle="-")
+
+            # Style spines
             for spine in ax.spines.values():
                 spine.set_color("#2a2f3a")
-            ax.grid(True, color="#1b1f27", alpha=0.6, linewidth=0.8, linestyle="--")
+                spine.set_linewidth(0.8)
+
+            # Remove top and right spines for cleaner look
+            ax.spines["top"].set_visible(False)
+            ax.spines["right"].set_visible(False)
         # Hide duplicate x labels on top axis
         self.ax_price.tick_params(labelbottom=False)
 
+        # Simplified legend focusing on patterns only
+        legend_elements = [
+            Line2D([0], [0], color="#00ff88", lw=2, label="📈 Bullish Pattern"),
+            Line2D([0], [0], color="#ff4444", lw=2, label="📉 Bearish Pattern"),
+            Line2D([0], [0], color="#ffaa00", lw=2, label="🔶 Neutral Pattern"),
+        ]
+        self.ax_price.legend(
+            handles=legend_elements,
+            loc="upper left",
+            frameon=True,
+            fancybox=True,
+            shadow=True,
+            framealpha=0.9,
+            facecolor="#1a1f2e",
+            edgecolor="#2a2f3a",
+            fontsize=9,
+        )
+
+        # Axis labels and date format
+        self.ax_price.set_ylabel("Price ($)", fontsize=12, color="#e6e8eb", fontweight="bold")
+        self.ax_vol.set_ylabel("Volume", fontsize=10, color="#e6e8eb", fontweight="bold")
+        self.ax_vol.set_xlabel("Date", fontsize=12, color="#e6e8eb", fontweight="bold")
+        # The date locator follows zoom and bar interval on its own, so it is
+        # installed once here rather than recomputed on every analysis
+        locator = mdates.AutoDateLocator(minticks=4, maxticks=10)
+        self.ax_price.xaxis.set_major_locator(locator)
+        self.ax_price.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        self.ax_vol.yaxis.set_major_formatter(FuncFormatter(_format_volume))
+
+        # Persistent data artists; each analysis swaps their data in place
+        self._wick_lines = LineCollection([], colors="#666666", linewidths=1, alpha=0.8)
+        self._candle_bodies = PolyCollection([], alpha=0.8, linewidths=1)
+        self._volume_bars = PolyCollection([], alpha=0.6, linewidths=0)
+        self._volume_bars.sticky_edges.y.append(0)  # keep bars on the axis, as bar() does
+        self.ax_price.add_collection(self._wick_lines)
+        self.ax_price.add_collection(self._candle_bodies)
+        self.ax_vol.add_collection(self._volume_bars)
+        (self._price_line,) = self.ax_price.plot(
+            [], [], color="#00d4ff", linewidth=2, alpha=0.9, label="💰 Close Price"
+        )
+        # Current-price marker, repositioned per analysis and hidden without a
+        # quote; animated like the overlays so a new quote only needs a blit
+        self._current_line = self.ax_price.axhline(
+            y=0, linestyle="--", alpha=0.8, linewidth=2, visible=False, animated=True
+        )
+        self._current_label = self.ax_price.annotate(
+            "",
+            xy=(0, 0),
+            xytext=(10, 0),
+            textcoords="offset points",
+            fontweight="bold",
+            fontsize=11,
+            bbox=dict(boxstyle="round,pad=0.3", alpha=0.2),
+            visible=False,
+            animated=True,
+        )
+        self._data_artists = (
+            self._wick_lines,
+            self._candle_bodies,
+            self._volume_bars,
+            self._price_line,
+            self._current_line,
+            self._current_label,
+        )
+
         # Enhanced canvas with better integration
         self.canvas = FigureCanvasTkAgg(self.fig, chart_frame)
         self.canvas.draw()
+        # Every full draw re-captures the background and paints the overlays
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("resize_event", self._on_resize)
+        self.ax_price.callbacks.connect("xlim_changed", self._on_xlim_changed)
         canvas_widget = self.canvas.get_tk_widget()
         canvas_widget.configure(bg="#0a0e13", highlightthickness=0)
         canvas_widget.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -266,10 +682,23 @@ class CryptVaultDesktopCharts:
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
         status_bar.pack(fill=tk.X, pady=(10, 0))
 
+        # Filter toggles only redraw the pattern overlays, coalesced by
+        # _schedule_filter_update so a burst of clicks costs one redraw
+        for var in (
+            self.show_rectangles,
+            self.show_triangles,
+            self.show_divergence,
+            self.show_channels,
+            self.show_wedges,
+            self.show_flags,
+        ):
+            var.trace_add("write", lambda *_: self._schedule_filter_update())
+
         # Bind events
-        symbol_entry.bind("<Return>", lambda e: self.analyze_symbol())
-        days_entry.bind("<Return>", lambda e: self.analyze_symbol())
-        interval_combo.bind("<Return>", lambda e: self.analyze_symbol())
+        # Repeated Return presses collapse into one analysis request
+        symbol_entry.bind("<Return>", lambda e: self._schedule_analysis())
+        days_entry.bind("<Return>", lambda e: self._schedule_analysis())
+        interval_combo.bind("<Return>", lambda e: self._schedule_analysis())
 
     def analyze_symbol(self):
         """Analyze the selected symbol."""
@@ -285,127 +714,225 @@ class CryptVaultDesktopCharts:
             messagebox.showerror("Error", "Please enter valid days (number)")
             return
 
+        # One analysis at a time: repeated Return presses while one is running
+        # collapse into a single rerun with the latest settings
+        if self._pending_analysis is not None:
+            self._restart_requested = (symbol, days, interval)
+            self.status_var.set(f"Analyzing... ({symbol} queued)")
+            return
+        self._start_analysis(symbol, days, interval)
+
+    def _start_analysis(self, symbol, days, interval):
+        """Submit a background analysis for the given settings."""
         self.status_var.set(f"Analyzing {symbol}...")
-        self.root.update()
+        self.root.update_idletasks()
         # Remember current settings for chart fetch
         self._current_days = days
         self._current_interval = interval
 
-        # Run analysis in thread to prevent UI freezing
-        thread = threading.Thread(target=self._run_analysis, args=(symbol, days, interval))
-        thread.daemon = True
-        thread.start()
+        # Run analysis off the Tk thread to prevent UI freezing
+        self._analysis_id += 1
+        self._pending_analysis = _spawn(
+            self._run_analysis, self._analysis_id, symbol, days, interval
+        )
 
-    def _run_analysis(self, symbol, days, interval):
+    def _on_close(self):
+        """Drop queued work and stop the analysis worker before closing the window."""
+        for job in (self._filter_job, self._select_job, self._analyze_job):
+            if job is not None:
+                self.root.after_cancel(job)
+        self._restart_requested = None
+        # An analysis already running finishes on its daemon thread; the
+        # bumped id marks it stale, so it never touches the destroyed root
+        self._analysis_id += 1
+        if self._pending_analysis is not None:
+            self._pending_analysis.cancel()
+        self.root.destroy()
+
+    def _on_analysis_done(self):
+        """Clear the in-flight analysis and service a queued rerun (UI thread)."""
+        self._pending_analysis = None
+        restart, self._restart_requested = self._restart_requested, None
+        if restart is not None:
+            self._start_analysis(*restart)
+
+    def _run_analysis(self, request_id, symbol, days, interval):
         """Run analysis in background thread."""
         try:
-            # Perform analysis
+            # Fetch chart bars and perform analysis concurrently
+            fut_data = _spawn(self._fetch_bars, symbol, days, interval)
             results = self.analyzer.analyze_ticker(symbol, days=days, interval=interval)
+            raw_data, series = fut_data.result()
+
+            if hasattr(results, "to_dict"):
+                results = results.to_dict()
 
             if not results["success"]:
-                self.root.after(0, lambda: self._show_error(f"Analysis failed: {results['error']}"))
+                error = "; ".join(results.get("errors") or []) or "unknown error"
+                self._post_result(request_id, lambda: self._show_error(f"Analysis failed: {error}"))
                 return
 
+            # Parse confidences once here so the UI thread only reads "_conf";
+            # overlays and list share this order (sorted by confidence desc)
+            patterns = results.get("patterns") or []
+            confs = np.fromiter(map(_parse_confidence, patterns), np.float64, len(patterns))
+            for pattern, conf in zip(patterns, confs.tolist()):
+                pattern["_conf"] = conf
+            # Stable descending order, ties keep the analyzer's order
+            order = np.argsort(-confs, kind="stable")
+            results["patterns"] = [patterns[i] for i in order]
+
             # Update UI in main thread
-            self.root.after(0, lambda: self._update_chart(results, symbol))
+            self._post_result(
+                request_id, lambda: self._apply_result(request_id, results, symbol, raw_data, series)
+            )
 
         except Exception as exc:
             error_msg = f"Analysis error: {str(exc)}"
-            self.root.after(0, lambda: self._show_error(error_msg))
+            self._post_result(request_id, lambda: self._show_error(error_msg))
+        finally:
+            # Queued after the chart update so a rerun starts from fresh state
+            self._post_result(request_id, self._on_analysis_done)
+
+    def _post_result(self, request_id, callback):
+        """Queue ``callback`` on the Tk thread unless ``request_id`` is stale (worker thread).
+
+        Ids only go stale when the window closes, so a stale worker must not
+        touch the root, which may already be destroyed.
+        """
+        if request_id != self._analysis_id:
+            logging.debug("Dropping result of analysis %d after close", request_id)
+            return
+        self._post_to_ui(callback)
 
-    def _update_chart(self, results, symbol):
-        """Update the chart with analysis results."""
+    def _post_to_ui(self, callback):
+        """Queue ``callback`` on the Tk thread from a worker; dropped if the window is gone."""
         try:
-            # Clear previous chart
-            self.ax_price.clear()
-            self.ax_vol.clear()
-
-            # Enhanced axis styling with modern dark theme
-            for ax in (self.ax_price, self.ax_vol):
-                ax.set_facecolor("#0f1419")
-                ax.tick_params(colors="#e6e8eb", labelsize=10)
-                ax.grid(True, color="#1e2329", alpha=0.4, linewidth=0.5, linestyle="-")
-
-                # Style spines
-                for spine in ax.spines.values():
-                    spine.set_color("#2a2f3a")
-                    spine.set_linewidth(0.8)
-
-            # Remove top and right spines for cleaner look
-            self.ax_price.spines["top"].set_visible(False)
-            self.ax_price.spines["right"].set_visible(False)
-            self.ax_vol.spines["top"].set_visible(False)
-            self.ax_vol.spines["right"].set_visible(False)
-
-            # Get data
-            patterns_raw = results.get("patterns", [])
-            # Use a consistent order for overlays and list (sorted by confidence desc)
-            self._display_patterns = sorted(
-                patterns_raw,
-                key=lambda p: float(p.get("confidence", "0").rstrip("%")),
-                reverse=True,
+            self.root.after(0, callback)
+        except (RuntimeError, tk.TclError):
+            logging.debug("Window closed; dropping UI callback from worker")
+
+    def _apply_result(self, request_id, results, symbol, raw_data, series):
+        """Draw an analysis result unless a newer request has been submitted."""
+        if request_id != self._analysis_id:
+            logging.debug("Dropping stale analysis result for %s", symbol)
+            return
+        self._update_chart(results, symbol, raw_data, series)
+
+    def _fetch_bars(self, symbol, days, interval):
+        """
+        Fetch chart bars and their plotting columns, reusing a recent fetch.
+
+        Returns ``(raw_data, series)`` where ``series`` is the downsampled
+        ``(dates, x, opens, highs, lows, closes, volumes)`` tuple, ``x`` being
+        the dates as matplotlib day numbers, or ``None``
+        when there are too few bars to chart. Runs on the worker thread.
+        """
+        key = (symbol, days, interval)
+        cached = self._data_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _FETCH_TTL:
+            return cached[1], cached[2]
+
+        raw_data = self.data_fetcher.fetch_historical_data(symbol, days, interval)
+        series = None
+        if raw_data and len(raw_data.data) >= 2:
+            data_points = raw_data.data
+            n = len(data_points)
+            # Build the float columns here so the Tk thread only plots them;
+            # bound draw cost on long intraday histories, raw_data keeps the
+            # full-resolution bars for export
+            series = _downsample_ohlc(
+                [point.timestamp for point in data_points],
+                np.fromiter((point.open for point in data_points), np.float64, n),
+                np.fromiter((point.high for point in data_points), np.float64, n),
+                np.fromiter((point.low for point in data_points), np.float64, n),
+                np.fromiter((point.close for point in data_points), np.float64, n),
+                np.fromiter(
+                    (getattr(point, "volume", 0) or 0 for point in data_points), np.float64, n
+                ),
+            )
+            # Every plotter draws against day numbers, converted once per dataset.
+            # Prices and volumes go to Agg as float32 to halve the vertex
+            # buffers; x stays float64 as float32 day numbers only resolve
+            # to a few minutes, too coarse for intraday bars
+            dates, *columns = series
+            series = (
+                dates,
+                mdates.date2num(dates),
+                *(np.asarray(column, dtype=np.float32) for column in columns),
             )
+            # Re-insert so a refreshed key counts as newest, then evict FIFO
+            self._data_cache.pop(key, None)
+            self._data_cache[key] = (time.monotonic(), raw_data, series)
+            while len(self._data_cache) > _FETCH_CACHE_SIZE:
+                del self._data_cache[next(iter(self._data_cache))]
+        return raw_data, series
+
+    def _update_chart(self, results, symbol, raw_data, series):
+        """Update the chart with analysis results and the prefetched bars."""
+        try:
+            # Get data
+            # Patterns arrive sorted by confidence from _run_analysis
+            self._display_patterns = results.get("patterns", [])
+            self._pattern_index_cache = {}
             ticker_info = results.get("ticker_info", {})
             current_price = ticker_info.get("current_price", 0)
 
             # Update pattern list
             self._update_pattern_list(self._display_patterns)
 
-            # Get historical data for charting
-            from cryptvault.data.fetchers import DataFetcher
+            # Same bars as the cached background: only the overlays can differ
+            sig = self._background_signature(symbol, series)
+            if (
+                sig is not None
+                and sig == self._last_bg_sig
+                and self._chart_series
+                and self._bg is not None
+                and self._price_in_view(current_price)
+            ):
+                self._set_current_price(current_price, series[1], series[5])
+                self._refresh_overlays()
+                self.status_var.set(
+                    f"✅ Found {len(self._display_patterns)} patterns for {symbol}"
+                )
+                return
+            self._last_bg_sig = None
+            prev_dates = self._chart_series[0] if self._chart_series else None
 
-            data_fetcher = DataFetcher()
-            raw_data = data_fetcher.fetch(
-                symbol, days=self._current_days, interval=self._current_interval
-            )
+            # Remove previous data artists; axis styling is kept from setup_ui
+            self._clear_chart_artists()
 
-            if not raw_data or len(raw_data.data) < 2:
+            if series is None:
                 self._show_error("Insufficient data for charting")
                 return
-
-            # Convert to DataFrame for easier plotting
-            data_points = raw_data.data
-            dates = [point.timestamp for point in data_points]
-            opens = [point.open for point in data_points]
-            highs = [point.high for point in data_points]
-            lows = [point.low for point in data_points]
-            closes = [point.close for point in data_points]
-            volumes = [getattr(point, "volume", 0) or 0 for point in data_points]
+            self.current_data = raw_data
+            dates, x, opens, highs, lows, closes, volumes = series
+            if prev_dates is not dates:
+                self._chart_date_ts = None
+            self._chart_series = (dates, x, opens, highs, lows, closes)
 
             # Plot candlesticks with enhanced gradient effects
-            self._plot_candlesticks(dates, opens, highs, lows, closes)
+            self._plot_candlesticks(x, opens, highs, lows, closes)
 
             # Plot volume with enhanced styling
-            self._plot_volume(dates, volumes, closes)
-
-            # Plot patterns on the chart (main focus - no indicators)
-            self._plot_patterns(self._display_patterns, dates, opens, highs, lows, closes)
+            self._plot_volume(x, volumes, closes)
 
             # Enhanced price line with gradient effect
-            self.ax_price.plot(
-                dates, closes, color="#00d4ff", linewidth=2, alpha=0.9, label="💰 Close Price"
-            )
+            self._price_line.set_data(x, closes)
 
-            # Simplified legend focusing on patterns only
-            legend_elements = [
-                Line2D([0], [0], color="#00ff88", lw=2, label="📈 Bullish Pattern"),
-                Line2D([0], [0], color="#ff4444", lw=2, label="📉 Bearish Pattern"),
-                Line2D([0], [0], color="#ffaa00", lw=2, label="🔶 Neutral Pattern"),
-            ]
-
-            self.ax_price.legend(
-                handles=legend_elements,
-                loc="upper left",
-                frameon=True,
-                fancybox=True,
-                shadow=True,
-                framealpha=0.9,
-                facecolor="#1a1f2e",
-                edgecolor="#2a2f3a",
-                fontsize=9,
+            # Data limits from the refreshed persistent artists
+            half_step = 0.5 * (float(np.median(np.diff(x))) if len(x) > 1 else 1.0)
+            self.ax_price.relim(visible_only=True)
+            self.ax_price.update_datalim(
+                [(x[0] - half_step, np.min(lows)), (x[-1] + half_step, np.max(highs))]
             )
+            self.ax_vol.relim()
+            self.ax_vol.update_datalim([(x[0] - half_step, 0.0), (x[-1] + half_step, np.max(volumes))])
 
-            # Enhanced titles and labels
+            # Plot patterns on the chart (main focus - no indicators)
+            self._plot_overlays()
+
+            # Enhanced title
             self.ax_price.set_title(
                 f"📊 {symbol} - Pattern Analysis",
                 fontsize=16,
@@ -413,48 +940,19 @@ class CryptVaultDesktopCharts:
                 color="#00d4ff",
                 pad=20,
             )
-            self.ax_price.set_ylabel("Price ($)", fontsize=12, color="#e6e8eb", fontweight="bold")
-            self.ax_vol.set_ylabel("Volume", fontsize=10, color="#e6e8eb", fontweight="bold")
-            self.ax_vol.set_xlabel("Date", fontsize=12, color="#e6e8eb", fontweight="bold")
-
-            # Format x-axis dates
-            self.ax_price.xaxis.set_major_formatter(mdates.DateFormatter("%m/%d"))
-            self.ax_price.xaxis.set_major_locator(
-                mdates.DayLocator(interval=max(1, len(dates) // 10))
-            )
-
-            # Rotate date labels for better readability
-            plt.setp(self.ax_vol.xaxis.get_majorticklabels(), rotation=45, ha="right")
 
             # Add current price indicator
+            self._set_current_price(current_price, x, closes)
             if current_price > 0:
-                price_color = "#00ff88" if closes[-1] >= closes[0] else "#ff4444"
-                self.ax_price.axhline(
-                    y=current_price,
-                    color=price_color,
-                    linestyle="--",
-                    alpha=0.8,
-                    linewidth=2,
-                    label=f"Current: ${current_price:.2f}",
-                )
-
-                # Add price annotation
-                self.ax_price.annotate(
-                    f"${current_price:.2f}",
-                    xy=(dates[-1], current_price),
-                    xytext=(10, 0),
-                    textcoords="offset points",
-                    color=price_color,
-                    fontweight="bold",
-                    fontsize=11,
-                    bbox=dict(boxstyle="round,pad=0.3", facecolor=price_color, alpha=0.2),
-                )
+                self.ax_price.update_datalim([(x[-1], current_price)], updatex=False)
 
-            # Tight layout for better spacing
-            self.fig.tight_layout()
+            self.ax_price.autoscale_view()
+            self.ax_vol.autoscale_view()
 
-            # Refresh canvas
-            self.canvas.draw()
+            # Refresh canvas on the next idle pass; a burst of updates coalesces
+            # into one render, and _on_draw re-captures the background
+            self.canvas.draw_idle()
+            self._last_bg_sig = sig
 
             # Update status
             pattern_count = len(self._display_patterns)
@@ -462,308 +960,410 @@ class CryptVaultDesktopCharts:
 
         except Exception as e:
             self._show_error(f"Chart update error: {str(e)}")
-            logging.error(f"Chart update error: {e}", exc_info=True)
-
-    def _draw_head_shoulders(self, x_range, highs_range, lows_range, color):
-        """Draw head and shoulders pattern."""
-        try:
-            arr = np.array(highs_range)
-            if len(arr) < 5:
-                return
+            logging.error("Chart update error: %s", e, exc_info=True)
+
+    def _set_current_price(self, current_price, x, closes):
+        """Move the current-price line and label, hiding both without a quote."""
+        visible = current_price > 0
+        self._current_line.set_visible(visible)
+        self._current_label.set_visible(visible)
+        if not visible:
+            return
+        price_color = "#00ff88" if closes[-1] >= closes[0] else "#ff4444"
+        self._current_line.set_ydata([current_price, current_price])
+        self._current_line.set_color(price_color)
+        self._current_line.set_label(f"Current: ${current_price:.2f}")
+
+        self._current_label.set_text(f"${current_price:.2f}")
+        self._current_label.xy = (x[-1], current_price)
+        self._current_label.set_color(price_color)
+        self._current_label.get_bbox_patch().set_facecolor(price_color)
+
+    def _price_in_view(self, current_price):
+        """True when the quote can be blitted without rescaling the price axis."""
+        if current_price <= 0:
+            return True
+        low, high = self.ax_price.get_ylim()
+        return low <= current_price <= high
+
+    @staticmethod
+    def _background_signature(symbol, series):
+        """Cheap fingerprint of the bars behind the cached background, or None."""
+        if series is None:
+            return None
+        x, closes = series[1], series[5]
+        return (symbol, len(closes), float(closes[0]), float(closes[-1]), x[0], x[-1])
 
-            # Find the head (highest peak)
-            peak_idx = int(np.argmax(arr))
-            if peak_idx < 2 or peak_idx >= len(arr) - 2:
-                return  # Not enough points on either side
+    def _on_xlim_changed(self, ax):
+        """Forget the background signature once the user pans or zooms."""
+        self._last_bg_sig = None
 
-            # Find shoulders (local maxima on either side)
-            left_peak = np.argmax(arr[:peak_idx])
-            right_peak = peak_idx + 1 + np.argmax(arr[peak_idx + 1 :])
+    def _clear_chart_artists(self):
+        """Remove plotted data from both axes while keeping their styling."""
+        persistent = self._data_artists
+        for ax in (self.ax_price, self.ax_vol):
+            for artist in (*ax.lines, *ax.collections, *ax.patches, *ax.texts):
+                if artist not in persistent:
+                    artist.remove()
+            ax.set_autoscale_on(True)
+        self._wick_lines.set_segments([])
+        self._candle_bodies.set_verts([])
+        self._volume_bars.set_verts([])
+        self._price_line.set_data([], [])
+        self._current_line.set_visible(False)
+        self._current_label.set_visible(False)
+        for ax in (self.ax_price, self.ax_vol):
+            ax.relim(visible_only=True)
+        self._pattern_annots = []
+        self._overlay_artists = []
+        # Nothing is charted until the next dataset is drawn, so filter
+        # toggles and list selections have no bars to work against
+        self._chart_series = ()
+        self._pattern_ranges = np.empty((0, 2), dtype=np.int32)
+        self.ax_price.set_title("")
+        # The cached pixels no longer match; wait for the next full draw, and
+        # never treat the next dataset as already drawn (the screen may hold
+        # an error message by then)
+        self._bg = None
+        self._last_bg_sig = None
+
+    def _plot_overlays(self):
+        """Plot the pattern overlays as animated artists kept out of the background."""
+        before = set(self.ax_price.get_children())
+        self._plot_patterns(self._display_patterns, *self._chart_series)
+        self._overlay_artists = [a for a in self.ax_price.get_children() if a not in before]
+        for artist in self._overlay_artists:
+            artist.set_animated(True)
+
+    def _draw_overlays(self):
+        """Paint the animated overlay and current-price artists onto the canvas buffer."""
+        draw_artist = self.ax_price.draw_artist
+        for artist in self._overlay_artists:
+            if artist.get_visible():
+                draw_artist(artist)
+        if self._current_line.get_visible():
+            draw_artist(self._current_line)
+            draw_artist(self._current_label)
+
+    def _on_draw(self, event):
+        """Cache the freshly drawn background, then paint the overlays on top.
+
+        Draws made by savefig (e.g. the toolbar Save button) render at print
+        dpi into a separate buffer; they are not a background for the screen.
+        """
+        if self.canvas.is_saving() or event.renderer is not self.canvas.get_renderer():
+            return
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_overlays()
+
+    def _background_fits(self):
+        """True when the cached background covers exactly the current figure."""
+        if self._bg is None:
+            return False
+        x0, y0, x1, y1 = self._bg.get_extents()
+        bbox = self.fig.bbox
+        return (x1 - x0, y1 - y0) == (round(bbox.width), round(bbox.height))
+
+    def _on_resize(self, event):
+        """Drop the cached background; the redraw that follows re-captures it."""
+        self._bg = None
+
+    def _schedule_filter_update(self):
+        """Coalesce filter toggles into one overlay refresh 50 ms after the last."""
+        if self._filter_job is not None:
+            self.root.after_cancel(self._filter_job)
+        self._filter_job = self.root.after(50, self._apply_filters)
+
+    def _schedule_analysis(self, delay=250):
+        """Coalesce keyboard-triggered analyses into one run ``delay`` ms after the last."""
+        if self._analyze_job is not None:
+            self.root.after_cancel(self._analyze_job)
+        self._analyze_job = self.root.after(delay, self._run_scheduled_analysis)
+
+    def _run_scheduled_analysis(self):
+        """Start the analysis scheduled by _schedule_analysis."""
+        self._analyze_job = None
+        self.analyze_symbol()
+
+    def _apply_filters(self):
+        """Run the pending filter refresh scheduled by _schedule_filter_update."""
+        self._filter_job = None
+        self._snapshot_filters()
+        self._refresh_overlays()
+
+    def _snapshot_filters(self):
+        """Read the filter toggles once into the set of hidden pattern kinds."""
+        self._hidden_kinds = frozenset(
+            kind for kind, toggle in _KIND_FILTERS.items() if not getattr(self, toggle).get()
+        )
 
-            # Draw neckline (connect the troughs between shoulders and head)
-            left_trough = peak_idx - 1 - np.argmin(highs_range[peak_idx - 1 :: -1])
-            right_trough = peak_idx + 1 + np.argmin(highs_range[peak_idx + 1 :])
+    def _refresh_overlays(self):
+        """Re-plot pattern overlays after a filter toggle without redrawing candles."""
+        if not self._chart_series:
+            return
+        try:
+            for artist in self._overlay_artists:
+                artist.remove()
+            self._plot_overlays()
+            if not self._background_fits():
+                self.canvas.draw_idle()
+                return
+            self.canvas.restore_region(self._bg)
+            self._draw_overlays()
+            self.canvas.blit(self.fig.bbox)
+        except Exception as e:
+            logging.warning("Error refreshing pattern overlays: %s", e)
 
-            # Draw the pattern
-            self.ax_price.plot(
-                [x_range[left_peak], x_range[peak_idx], x_range[right_peak]],
-                [highs_range[left_peak], highs_range[peak_idx], highs_range[right_peak]],
-                color=color,
-                linestyle="--",
-                linewidth=1.4,
-                alpha=0.7,
-            )
+    def _draw_head_shoulders(self, x_range, highs_range, lows_range, color):
+        """Draw head and shoulders pattern; returns False if the window has no such shape."""
+        try:
+            # The compiled build is typed float64[:]; plain numpy reads the
+            # float32 window view as-is, without a copy
+            if NUMBA_AVAILABLE:
+                highs_range = np.ascontiguousarray(highs_range, dtype=np.float64)
+            points = _find_hns_points(highs_range)
+            if points[0] < 0:
+                return False  # Not enough points on either side of the head
+            left_peak, peak_idx, right_peak, left_trough, right_trough = map(int, points)
+
+            # Draw the pattern: shoulder -> head -> shoulder
+            for a, b in ((left_peak, peak_idx), (peak_idx, right_peak)):
+                self._queue_segment(
+                    x_range[a],
+                    highs_range[a],
+                    x_range[b],
+                    highs_range[b],
+                    color,
+                    linestyle="--",
+                    linewidth=1.4,
+                    alpha=0.7,
+                )
 
             # Draw neckline
-            self.ax_price.plot(
-                [x_range[left_trough], x_range[right_trough]],
-                [highs_range[left_trough], highs_range[right_trough]],
-                color=color,
-                linestyle="-",
+            self._queue_segment(
+                x_range[left_trough],
+                highs_range[left_trough],
+                x_range[right_trough],
+                highs_range[right_trough],
+                color,
                 linewidth=1.2,
                 alpha=0.7,
             )
 
-            # Label
-            self.ax_price.annotate(
+            # Label just above the head; clipped to the axes so a head at the
+            # top of the price range cannot push it into the title
+            self._annotate_pattern(
                 "Head & Shoulders",
                 xy=(x_range[peak_idx], highs_range[peak_idx]),
-                xytext=(0, 30),
-                textcoords="offset points",
+                xytext=(0, 8),
                 ha="center",
+                va="bottom",
                 color=color,
+                clip_on=True,
+                annotation_clip=True,
             )
+            return True
         except Exception as e:
-            logging.warning(f"Error drawing head & shoulders: {e}")
+            logging.warning("Error drawing head & shoulders: %s", e)
+            return False
 
     # Removed _plot_indicators method to simplify chart display
 
-    def _plot_candlesticks(self, dates, opens, highs, lows, closes):
-        """Plot candlestick chart with enhanced gradient effects."""
+    def _plot_candlesticks(self, x, opens, highs, lows, closes):
+        """Update the persistent candle body and wick collections."""
         try:
-            from matplotlib.patches import Rectangle
-
-            # Calculate colors for each candlestick
-            colors = [
-                "#00ff88" if close >= open else "#ff4444" for open, close in zip(opens, closes)
-            ]
-
-            # Plot candlesticks
-            for i, (date, open_price, high, low, close, color) in enumerate(
-                zip(dates, opens, highs, lows, closes, colors)
-            ):
-                # Draw the wick (high-low line)
-                self.ax_price.plot(
-                    [date, date], [low, high], color="#666666", linewidth=1, alpha=0.8
-                )
-
-                # Draw the body (rectangle)
-                body_height = abs(close - open_price)
-                body_bottom = min(open_price, close)
-
-                # Create rectangle for candlestick body
-                rect = Rectangle(
-                    (mdates.date2num(date) - 0.3, body_bottom),
-                    0.6,
-                    body_height,
-                    facecolor=color,
-                    edgecolor=color,
-                    alpha=0.8,
-                    linewidth=1,
-                )
-                self.ax_price.add_patch(rect)
+            # x holds matplotlib day numbers; bodies span 60% of the bar
+            # spacing so intraday and downsampled series don't overlap
+            step = float(np.median(np.diff(x))) if len(x) > 1 else 1.0
+            half_width = 0.3 * step
+
+            opens = np.asarray(opens, dtype=np.float32)
+            closes = np.asarray(closes, dtype=np.float32)
+            body_bottom = np.minimum(opens, closes)
+            body_top = np.maximum(opens, closes)
+
+            # Up/down colour per candle picked from two RGBA rows; hex strings
+            # would be parsed again for every bar on each update
+            colors = np.where((closes >= opens)[:, None], _UP_RGBA, _DOWN_RGBA)
+
+            # Wicks (high-low lines) as a single (N, 2, 2) segment array
+            wicks = np.stack(
+                [np.column_stack([x, lows]), np.column_stack([x, highs])], axis=1
+            )
+            self._wick_lines.set_segments(wicks)
+
+            # Bodies as (N, 4, 2) rectangles
+            left, right = x - half_width, x + half_width
+            bodies = np.stack(
+                [
+                    np.column_stack([left, body_bottom]),
+                    np.column_stack([right, body_bottom]),
+                    np.column_stack([right, body_top]),
+                    np.column_stack([left, body_top]),
+                ],
+                axis=1,
+            )
+            self._candle_bodies.set_verts(bodies)
+            self._candle_bodies.set_facecolor(colors)
+            self._candle_bodies.set_edgecolor(colors)
+            self.ax_price.xaxis_date()
 
         except Exception as e:
-            logging.error(f"Error plotting candlesticks: {e}")
+            logging.error("Error plotting candlesticks: %s", e)
             # Fallback to simple line plot
-            self.ax_price.plot(dates, closes, color="#00d4ff", linewidth=2, alpha=0.9)
+            self.ax_price.plot(x, closes, color="#00d4ff", linewidth=2, alpha=0.9)
 
-    def _plot_volume(self, dates, volumes, closes):
+    def _plot_volume(self, x, volumes, closes):
         """Plot volume bars with color coding based on price movement."""
         try:
-            if not volumes or all(v == 0 for v in volumes):
+            if not len(volumes) or not np.any(volumes):
                 return
 
-            # Calculate colors based on price movement
-            colors = []
-            for i in range(len(closes)):
-                if i == 0:
-                    colors.append("#666666")  # Neutral for first bar
-                else:
-                    colors.append("#00ff88" if closes[i] >= closes[i - 1] else "#ff4444")
-
-            # Plot volume bars
-            self.ax_vol.bar(dates, volumes, color=colors, alpha=0.6, width=0.8)
-
-            # Format volume axis
-            self.ax_vol.yaxis.set_major_formatter(
-                plt.FuncFormatter(lambda x, p: f"{x/1e6:.1f}M" if x >= 1e6 else f"{x/1e3:.0f}K")
+            # Colour by price movement against the prior close, as RGBA rows
+            closes = np.asarray(closes, dtype=np.float32)
+            colors = np.empty((len(closes), 4))
+            colors[1:] = np.where((np.diff(closes) >= 0)[:, None], _UP_RGBA, _DOWN_RGBA)
+            colors[0] = _FLAT_RGBA  # Neutral for first bar
+
+            # Volume bars as (N, 4, 2) rectangles in the persistent collection
+            step = float(np.median(np.diff(x))) if len(x) > 1 else 1.0
+            left, right = x - 0.4 * step, x + 0.4 * step
+            zeros = np.zeros(len(x), dtype=np.float32)
+            volumes = np.asarray(volumes, dtype=np.float32)
+            self._volume_bars.set_verts(
+                np.stack(
+                    [
+                        np.column_stack([left, zeros]),
+                        np.column_stack([right, zeros]),
+                        np.column_stack([right, volumes]),
+                        np.column_stack([left, volumes]),
+                    ],
+                    axis=1,
+                )
             )
+            self._volume_bars.set_facecolor(colors)
+            self.ax_vol.xaxis_date()
 
         except Exception as e:
-            logging.error(f"Error plotting volume: {e}")
+            logging.error("Error plotting volume: %s", e)
 
     def _draw_triangle(self, x_range, highs_range, lows_range, color, ptype):
         """Draw triangle pattern."""
         try:
             # Draw upper trend line
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [highs_range[0], highs_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
+            self._queue_segment(x_range[0], highs_range[0], x_range[-1], highs_range[-1], color)
 
             # Draw lower trend line
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [lows_range[0], lows_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
+            self._queue_segment(x_range[0], lows_range[0], x_range[-1], lows_range[-1], color)
 
             # Add pattern label
             mid_x = x_range[len(x_range) // 2]
-            mid_y = (max(highs_range) + min(lows_range)) / 2
-            self.ax_price.annotate(
+            mid_y = (highs_range.max() + lows_range.min()) / 2
+            self._annotate_pattern(
                 ptype,
                 xy=(mid_x, mid_y),
                 xytext=(0, 10),
-                textcoords="offset points",
                 ha="center",
                 color=color,
                 fontsize=9,
                 fontweight="bold",
             )
         except Exception as e:
-            logging.warning(f"Error drawing triangle: {e}")
+            logging.warning("Error drawing triangle: %s", e)
 
     def _draw_expanding_triangle(self, x_range, highs_range, lows_range, color):
         """Draw expanding triangle pattern."""
         try:
             # Draw expanding upper trend line
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [highs_range[0], highs_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
+            self._queue_segment(x_range[0], highs_range[0], x_range[-1], highs_range[-1], color)
 
             # Draw expanding lower trend line
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [lows_range[0], lows_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
+            self._queue_segment(x_range[0], lows_range[0], x_range[-1], lows_range[-1], color)
 
             # Add pattern label
             mid_x = x_range[len(x_range) // 2]
-            mid_y = (max(highs_range) + min(lows_range)) / 2
-            self.ax_price.annotate(
+            mid_y = (highs_range.max() + lows_range.min()) / 2
+            self._annotate_pattern(
                 "Expanding Triangle",
                 xy=(mid_x, mid_y),
                 xytext=(0, 10),
-                textcoords="offset points",
                 ha="center",
                 color=color,
                 fontsize=9,
                 fontweight="bold",
             )
         except Exception as e:
-            logging.warning(f"Error drawing expanding triangle: {e}")
+            logging.warning("Error drawing expanding triangle: %s", e)
 
     def _draw_rectangle(self, x_range, highs_range, lows_range, key_levels, color, ptype):
         """Draw rectangle/channel pattern."""
         try:
             # Draw horizontal support and resistance lines
-            support = min(lows_range)
-            resistance = max(highs_range)
+            support = lows_range.min()
+            resistance = highs_range.max()
 
-            self.ax_price.axhline(
-                y=support, xmin=0, xmax=1, color=color, linestyle="-", linewidth=2, alpha=0.8
-            )
-            self.ax_price.axhline(
-                y=resistance, xmin=0, xmax=1, color=color, linestyle="-", linewidth=2, alpha=0.8
-            )
+            # Span the pattern window rather than the whole axes
+            self._queue_segment(x_range[0], support, x_range[-1], support, color)
+            self._queue_segment(x_range[0], resistance, x_range[-1], resistance, color)
 
             # Add pattern label
             mid_x = x_range[len(x_range) // 2]
             mid_y = (resistance + support) / 2
-            self.ax_price.annotate(
+            self._annotate_pattern(
                 ptype,
                 xy=(mid_x, mid_y),
                 xytext=(0, 0),
-                textcoords="offset points",
                 ha="center",
                 color=color,
                 fontsize=9,
                 fontweight="bold",
             )
         except Exception as e:
-            logging.warning(f"Error drawing rectangle: {e}")
+            logging.warning("Error drawing rectangle: %s", e)
 
     def _draw_channel(self, x_range, highs_range, lows_range, color, ptype):
         """Draw channel pattern."""
         try:
             # Draw parallel trend lines
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [highs_range[0], highs_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [lows_range[0], lows_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
+            self._queue_segment(x_range[0], highs_range[0], x_range[-1], highs_range[-1], color)
+            self._queue_segment(x_range[0], lows_range[0], x_range[-1], lows_range[-1], color)
 
             # Add pattern label
             mid_x = x_range[len(x_range) // 2]
-            mid_y = (max(highs_range) + min(lows_range)) / 2
-            self.ax_price.annotate(
+            mid_y = (highs_range.max() + lows_range.min()) / 2
+            self._annotate_pattern(
                 ptype,
                 xy=(mid_x, mid_y),
                 xytext=(0, 10),
-                textcoords="offset points",
                 ha="center",
                 color=color,
                 fontsize=9,
                 fontweight="bold",
             )
         except Exception as e:
-            logging.warning(f"Error drawing channel: {e}")
+            logging.warning("Error drawing channel: %s", e)
 
     def _draw_wedge(self, x_range, highs_range, lows_range, color, ptype):
         """Draw wedge pattern."""
         try:
             # Draw converging trend lines
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [highs_range[0], highs_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
-            self.ax_price.plot(
-                [x_range[0], x_range[-1]],
-                [lows_range[0], lows_range[-1]],
-                color=color,
-                linestyle="-",
-                linewidth=2,
-                alpha=0.8,
-            )
+            self._queue_segment(x_range[0], highs_range[0], x_range[-1], highs_range[-1], color)
+            self._queue_segment(x_range[0], lows_range[0], x_range[-1], lows_range[-1], color)
 
             # Add pattern label
             mid_x = x_range[len(x_range) // 2]
-            mid_y = (max(highs_range) + min(lows_range)) / 2
-            self.ax_price.annotate(
+            mid_y = (highs_range.max() + lows_range.min()) / 2
+            self._annotate_pattern(
                 ptype,
                 xy=(mid_x, mid_y),
                 xytext=(0, 10),
-                textcoords="offset points",
                 ha="center",
                 color=color,
                 fontsize=9,
                 fontweight="bold",
             )
         except Exception as e:
-            logging.warning(f"Error drawing wedge: {e}")
+            logging.warning("Error drawing wedge: %s", e)
 
     def _draw_flag(self, x_range, highs_range, lows_range, color, ptype):
         """Draw flag/pennant pattern."""
@@ -771,205 +1371,114 @@ class CryptVaultDesktopCharts:
             # Draw flag pole (initial strong move)
             pole_end = len(x_range) // 3
             if "bull" in ptype.lower():
-                self.ax_price.plot(
-                    [x_range[0], x_range[pole_end]],
-                    [lows_range[0], highs_range[pole_end]],
-                    color=color,
-                    linestyle="-",
+                self._queue_segment(
+                    x_range[0],
+                    lows_range[0],
+                    x_range[pole_end],
+                    highs_range[pole_end],
+                    color,
                     linewidth=3,
                     alpha=0.9,
                 )
             else:
-                self.ax_price.plot(
-                    [x_range[0], x_range[pole_end]],
-                    [highs_range[0], lows_range[pole_end]],
-                    color=color,
-                    linestyle="-",
+                self._queue_segment(
+                    x_range[0],
+                    highs_range[0],
+                    x_range[pole_end],
+                    lows_range[pole_end],
+                    color,
                     linewidth=3,
                     alpha=0.9,
                 )
 
             # Draw flag (consolidation)
             flag_start = pole_end
-            self.ax_price.plot(
-                [x_range[flag_start], x_range[-1]],
-                [highs_range[flag_start], highs_range[-1]],
-                color=color,
+            self._queue_segment(
+                x_range[flag_start],
+                highs_range[flag_start],
+                x_range[-1],
+                highs_range[-1],
+                color,
                 linestyle="--",
-                linewidth=2,
-                alpha=0.8,
             )
-            self.ax_price.plot(
-                [x_range[flag_start], x_range[-1]],
-                [lows_range[flag_start], lows_range[-1]],
-                color=color,
+            self._queue_segment(
+                x_range[flag_start],
+                lows_range[flag_start],
+                x_range[-1],
+                lows_range[-1],
+                color,
                 linestyle="--",
-                linewidth=2,
-                alpha=0.8,
             )
 
             # Add pattern label
             mid_x = x_range[len(x_range) // 2]
-            mid_y = (max(highs_range) + min(lows_range)) / 2
-            self.ax_price.annotate(
+            mid_y = (highs_range.max() + lows_range.min()) / 2
+            self._annotate_pattern(
                 ptype,
                 xy=(mid_x, mid_y),
                 xytext=(0, 10),
-                textcoords="offset points",
                 ha="center",
                 color=color,
                 fontsize=9,
                 fontweight="bold",
             )
         except Exception as e:
-            logging.warning(f"Error drawing flag: {e}")
+            logging.warning("Error drawing flag: %s", e)
 
-    def _draw_head_and_shoulders(self, x_range, highs_range, lows_range, color):
-        """Draw head and shoulders pattern."""
-        try:
-            # Find the three peaks (left shoulder, head, right shoulder)
-            if len(highs_range) >= 3:
-                # Draw neckline
-                neckline_level = min(lows_range)
-                self.ax_price.axhline(
-                    y=neckline_level,
-                    xmin=0,
-                    xmax=1,
-                    color=color,
-                    linestyle="--",
-                    linewidth=2,
-                    alpha=0.8,
-                )
-
-                # Mark the peaks
-                for i, (x, high) in enumerate(
-                    zip(x_range[:: len(x_range) // 3], highs_range[:: len(highs_range) // 3])
-                ):
-                    if i < 3:  # Only mark first 3 peaks
-                        peak_names = ["Left Shoulder", "Head", "Right Shoulder"]
-                        self.ax_price.plot(x, high, "o", color=color, markersize=8, alpha=0.8)
-                        self.ax_price.annotate(
-                            peak_names[i],
-                            xy=(x, high),
-                            xytext=(0, 15),
-                            textcoords="offset points",
-                            ha="center",
-                            color=color,
-                            fontsize=8,
-                        )
-        except Exception as e:
-            logging.warning(f"Error drawing head and shoulders: {e}")
+    def _find_date_index(self, ts, date_ts, ordered=True):
+        """Find the nearest bar index for a datetime or epoch seconds in the ``date_ts`` seconds.
 
-    def _find_date_index(self, ts, dates):
-        """Find nearest index for a datetime in the dates array."""
+        ``date_ts`` is binary-searched unless ``ordered`` is False, in which
+        case it must be a float64 array and every bar is compared.
+        """
         try:
-            if ts is None:
-                return None
-            # Convert timestamp to comparable format
-            if hasattr(ts, "timestamp"):
-                target_ts = ts.timestamp()
-                # If timezone-aware, convert to UTC and make naive
-                if hasattr(ts, "tzinfo") and ts.tzinfo is not None:
-                    target_ts = ts.astimezone().timestamp()
-            elif isinstance(ts, (int, float)):
-                target_ts = ts
-            else:
+            target_ts = _to_timestamp(ts)
+            if target_ts is None or not len(date_ts):
                 return None
-
-            # Convert dates to timestamps for comparison
-            date_timestamps = []
-            for d in dates:
-                if hasattr(d, "timestamp"):
-                    ts_val = d.timestamp()
-                    # If timezone-aware, convert to UTC and make naive
-                    if hasattr(d, "tzinfo") and d.tzinfo is not None:
-                        ts_val = d.astimezone().timestamp()
-                    date_timestamps.append(ts_val)
-                elif isinstance(d, (int, float)):
-                    date_timestamps.append(d)
-                else:
-                    date_timestamps.append(0)
-
-            return max(
-                0,
-                min(
-                    len(dates) - 1,
-                    min(range(len(dates)), key=lambda i: abs(date_timestamps[i] - target_ts)),
-                ),
-            )
+            if not ordered:
+                return int(np.argmin(np.abs(date_ts - target_ts)))
+            return int(_nearest_index(date_ts, target_ts))
         except Exception as e:
-            logging.debug(f"Error in find_index: {e}")
+            logging.debug("Error in find_index: %s", e)
             return None
 
-    def _should_skip_pattern(self, ptype):
-        """Check if pattern should be skipped based on filter toggles."""
-        skip_conditions = [
-            ("rectangle" in ptype.lower() and not self.show_rectangles.get()),
-            ("triangle" in ptype.lower() and not self.show_triangles.get()),
-            ("channel" in ptype.lower() and not self.show_channels.get()),
-            ("wedge" in ptype.lower() and not self.show_wedges.get()),
-            ("flag" in ptype.lower() and not self.show_flags.get()),
-            ("pennant" in ptype.lower() and not self.show_flags.get()),
-            ("divergence" in ptype.lower() and not self.show_divergence.get()),
-        ]
-        return any(skip_conditions)
-
     def _get_pattern_color(self, ptype):
-        """Get color for pattern based on its type."""
-        ptype_lower = ptype.lower()
-        if "divergence" in ptype_lower:
-            return self.pattern_colors["divergence"]
-        if "channel" in ptype_lower:
-            return self.pattern_colors["channel"]
-        if "wedge" in ptype_lower:
-            return self.pattern_colors["wedge"]
-        if "flag" in ptype_lower or "pennant" in ptype_lower:
-            return self.pattern_colors["flag"]
-        if "triangle" in ptype_lower:
-            return self.pattern_colors["triangle"]
-        if "bull" in ptype_lower:
-            return self.pattern_colors["bullish"]
-        if "bear" in ptype_lower:
-            return self.pattern_colors["bearish"]
-        return self.pattern_colors["neutral"]
-
-    def _parse_datetime(self, timestamp):
-        """Parse datetime from various formats."""
+        """Get color for pattern based on its type, resolved once per pattern name."""
+        color = self._color_cache.get(ptype)
+        if color is None:
+            match = _COLOR_RE.match(ptype)
+            key = match.lastgroup if match and match.lastgroup else "neutral"
+            color = self._color_cache[ptype] = self.pattern_colors[key]
+        return color
+
+    def _parse_epoch(self, timestamp):
+        """Parse a pattern time (string, datetime or epoch number) to epoch seconds."""
         if not timestamp:
             return None
 
-        datetime_formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S.%f",
-        ]
-
         if isinstance(timestamp, str):
-            for fmt in datetime_formats:
-                try:
-                    return datetime.strptime(timestamp, fmt)
-                except ValueError:
-                    continue
-            logging.warning(f"Could not parse timestamp: {timestamp}")
-            return None
-        if hasattr(timestamp, "strftime"):
-            return timestamp
-        if isinstance(timestamp, (int, float)):
-            return datetime.fromtimestamp(timestamp)
-        return None
-
-    def _get_pattern_indices(self, pattern, dates):
-        """Get start and end indices for pattern."""
-        start_dt = self._parse_datetime(pattern.get("start_time"))
-        end_dt = self._parse_datetime(pattern.get("end_time"))
-
-        s_idx = self._find_date_index(start_dt, dates) if start_dt else 0
-        e_idx = self._find_date_index(end_dt, dates) if end_dt else len(dates) - 1
+            epoch = _epoch_from_string(timestamp)
+            if epoch is None:
+                logging.warning("Could not parse timestamp: %s", timestamp)
+            return epoch
+        # Epoch numbers pass straight through; no datetime round-trip
+        return _to_timestamp(timestamp)
+
+    def _get_pattern_indices(self, pattern, dates, date_ts):
+        """Get start and end indices for pattern; ``date_ts`` holds the bar times in seconds."""
+        start_ts = self._parse_epoch(pattern.get("start_time"))
+        end_ts = self._parse_epoch(pattern.get("end_time"))
+
+        ordered = self._chart_dates_ordered
+        s_idx = self._find_date_index(start_ts, date_ts, ordered) if start_ts is not None else 0
+        e_idx = (
+            self._find_date_index(end_ts, date_ts, ordered)
+            if end_ts is not None
+            else len(dates) - 1
+        )
 
         # If we couldn't parse dates, use pattern index-based approach
-        if start_dt is None and end_dt is None:
+        if start_ts is None and end_ts is None:
             pattern_idx = pattern.get("index", len(dates) - 1)
             if isinstance(pattern_idx, (int, float)):
                 pattern_idx = int(pattern_idx)
@@ -982,80 +1491,138 @@ class CryptVaultDesktopCharts:
 
         return s_idx, e_idx
 
-    def _draw_fallback_marker(self, ptype, color, dates, closes):
+    def _annotate_pattern(self, text, xy, xytext, textcoords="offset points", **kwargs):
+        """Annotate the price axis and remember the artist for later removal.
+
+        Pattern labels are offset from their anchor in points unless told otherwise.
+        """
+        annot = self.ax_price.annotate(text, xy=xy, xytext=xytext, textcoords=textcoords, **kwargs)
+        self._pattern_annots.append(annot)
+        return annot
+
+    def _queue_marker(self, marker, x, y, color):
+        """Queue a pattern marker; queued markers are drawn by _flush_markers."""
+        xs, ys, cs = self._pattern_markers.setdefault(marker, ([], [], []))
+        xs.append(x)
+        ys.append(y)
+        cs.append(color)
+
+    def _flush_markers(self):
+        """Draw all queued pattern markers with one scatter call per marker style."""
+        for marker, (xs, ys, cs) in self._pattern_markers.items():
+            if xs:
+                self.ax_price.scatter(xs, ys, c=cs, marker=marker, **_MARKER_STYLES[marker])
+        self._pattern_markers = {}
+
+    def _queue_segment(self, x0, y0, x1, y1, color, linestyle="-", linewidth=2, alpha=0.8):
+        """Queue a pattern trendline; queued lines are drawn by _flush_segments."""
+        key = (linestyle, linewidth, alpha)
+        for column, value in zip(
+            self._pattern_segments.setdefault(key, ([], [], [], [], [])), (x0, y0, x1, y1, color)
+        ):
+            column.append(value)
+
+    def _flush_segments(self):
+        """Draw all queued trendlines as a single LineCollection.
+
+        Styles are queued in groups; each group's width, dash pattern and alpha
+        (folded into the RGBA colours) are repeated per segment.
+        """
+        groups = [(style, cols) for style, cols in self._pattern_segments.items() if cols[4]]
+        self._pattern_segments = {}
+        if not groups:
+            return
+        x0, y0, x1, y1, colors, linestyles, linewidths, alphas = [], [], [], [], [], [], [], []
+        for (linestyle, linewidth, alpha), (gx0, gy0, gx1, gy1, cs) in groups:
+            x0 += gx0
+            y0 += gy0
+            x1 += gx1
+            y1 += gy1
+            colors += cs
+            linestyles += [linestyle] * len(cs)
+            linewidths += [linewidth] * len(cs)
+            alphas += [alpha] * len(cs)
+        segments = np.stack([np.column_stack([x0, y0]), np.column_stack([x1, y1])], axis=1)
+        self.ax_price.add_collection(
+            LineCollection(
+                segments,
+                colors=to_rgba_array(colors, alpha=alphas),
+                linestyles=linestyles,
+                linewidths=linewidths,
+                zorder=2,
+            )
+        )
+
+    def _flush_bands(self):
+        """Draw all queued default-pattern bands as one fill and one outline collection."""
+        bands = self._pattern_bands
+        self._pattern_bands = []
+        if not bands:
+            return
+        fills, outlines, colors = [], [], []
+        for xs, highs, lows, color in bands:
+            upper = np.column_stack([xs, highs])
+            lower = np.column_stack([xs, lows])
+            fills.append(np.concatenate([upper, lower[::-1]]))
+            outlines += (upper, lower)
+            colors.append(color)
+        self.ax_price.add_collection(
+            PolyCollection(fills, facecolors=colors, alpha=0.25, linewidths=0, zorder=5)
+        )
+        self.ax_price.add_collection(
+            LineCollection(
+                outlines,
+                colors=[c for c in colors for _ in (0, 1)],
+                linewidths=2.5,
+                alpha=0.95,
+                zorder=6,
+            )
+        )
+
+    def _draw_fallback_marker(self, ptype, color, xs, closes):
         """Draw fallback marker when pattern range is invalid."""
         try:
-            x = dates[-1]
+            x = xs[-1]
             y = closes[-1]
-            self.ax_price.scatter(
-                x,
-                y,
-                s=120,
-                c=color,
-                marker="*",
-                alpha=0.9,
-                edgecolors="#ffffff",
-                linewidth=2,
-                zorder=10,
-            )
-            self.ax_price.annotate(
+            self._queue_marker("*", x, y, color)
+            self._annotate_pattern(
                 f"📍 {ptype}",
                 xy=(x, y),
                 xytext=(20, 20),
-                textcoords="offset points",
                 color=color,
                 fontweight="bold",
-                bbox=dict(boxstyle="round,pad=0.3", facecolor=color, alpha=0.3, edgecolor=color),
+                bbox=_fallback_bbox(color),
                 zorder=11,
             )
-            self._pattern_ranges.append((len(dates) - 5, len(dates) - 1))
-            logging.info(f"Drew fallback marker for {ptype} at end of chart")
+            logging.info("Drew fallback marker for %s at end of chart", ptype)
         except Exception as e:
-            logging.warning(f"Failed to draw fallback marker: {e}")
+            logging.warning("Failed to draw fallback marker: %s", e)
 
     def _draw_default_pattern(
         self, x_range, highs_range, lows_range, closes, s_idx, e_idx, color, ptype
     ):
         """Draw default pattern visualization."""
         try:
-            logging.info(f"Drawing default pattern visualization for {ptype}")
-            self.ax_price.fill_between(
-                x_range, highs_range, lows_range, color=color, alpha=0.25, linewidth=0, zorder=5
-            )
-            self.ax_price.plot(
-                x_range, highs_range, color=color, linewidth=2.5, alpha=0.95, zorder=6
-            )
-            self.ax_price.plot(
-                x_range, lows_range, color=color, linewidth=2.5, alpha=0.95, zorder=6
-            )
+            logging.info("Drawing default pattern visualization for %s", ptype)
+            self._pattern_bands.append((x_range, highs_range, lows_range, color))
 
-            self.ax_price.scatter(
-                [x_range[0], x_range[-1]],
-                [highs_range[0], highs_range[-1]],
-                s=80,
-                c=color,
-                marker="o",
-                alpha=0.9,
-                edgecolors="white",
-                linewidth=2,
-                zorder=7,
-            )
+            self._queue_marker("o", x_range[0], highs_range[0], color)
+            self._queue_marker("o", x_range[-1], highs_range[-1], color)
 
             mid_price = (highs_range[-1] + lows_range[-1]) / 2
-            self.ax_price.annotate(
+            self._annotate_pattern(
                 f"🎯 {ptype}",
                 xy=(x_range[-1], mid_price),
                 xytext=(-100, 20),
-                textcoords="offset points",
                 color="white",
                 fontweight="bold",
                 fontsize=10,
-                bbox=dict(boxstyle="round,pad=0.4", facecolor=color, alpha=0.8, edgecolor="white"),
+                bbox=_label_bbox(color),
                 zorder=8,
             )
-            logging.info(f"Successfully drew default pattern for {ptype}")
+            logging.info("Successfully drew default pattern for %s", ptype)
         except Exception as e:
-            logging.warning(f"Error drawing default pattern {ptype}: {e}")
+            logging.warning("Error drawing default pattern %s: %s", ptype, e)
             try:
                 self.ax_price.plot(
                     x_range,
@@ -1065,51 +1632,92 @@ class CryptVaultDesktopCharts:
                     alpha=0.8,
                     zorder=5,
                 )
-                logging.info(f"Drew fallback line for {ptype}")
+                logging.info("Drew fallback line for %s", ptype)
             except Exception as e2:
-                logging.error(f"Even fallback line failed for {ptype}: {e2}")
+                logging.error("Even fallback line failed for %s: %s", ptype, e2)
 
     def _dispatch_pattern_drawing(
-        self, ptype, x_range, highs_range, lows_range, closes, s_idx, e_idx, key_levels, color
+        self, kind, ptype, x_range, highs_range, lows_range, closes, s_idx, e_idx, key_levels, color
     ):
-        """Dispatch to appropriate pattern drawing method."""
-        ptype_lower = ptype.lower()
-        if "rectangle" in ptype_lower:
+        """Dispatch to the drawing method for the pattern's kind (see _pattern_kind)."""
+        drawer = self._draw_dispatch.get(kind)
+        if drawer is not None:
+            drawer(x_range, highs_range, lows_range, color, ptype)
+        elif kind == "rectangle":
             self._draw_rectangle(x_range, highs_range, lows_range, key_levels, color, ptype)
-        elif "expanding triangle" in ptype_lower:
+        elif kind == "expanding_triangle":
             self._draw_expanding_triangle(x_range, highs_range, lows_range, color)
-        elif "triangle" in ptype_lower:
-            self._draw_triangle(x_range, highs_range, lows_range, color, ptype)
-        elif "channel" in ptype_lower:
-            self._draw_channel(x_range, highs_range, lows_range, color, ptype)
-        elif "wedge" in ptype_lower:
-            self._draw_wedge(x_range, highs_range, lows_range, color, ptype)
-        elif "flag" in ptype_lower or "pennant" in ptype_lower:
-            self._draw_flag(x_range, highs_range, lows_range, color, ptype)
-        elif "head and shoulders" in ptype_lower:
-            self._draw_head_and_shoulders(x_range, highs_range, lows_range, color)
-        elif "divergence" in ptype_lower:
-            self._draw_divergence(x_range, highs_range, lows_range, color, ptype)
-        else:
+        elif kind != "head_shoulders" or not self._draw_head_shoulders(
+            x_range, highs_range, lows_range, color
+        ):
             self._draw_default_pattern(
                 x_range, highs_range, lows_range, closes, s_idx, e_idx, color, ptype
             )
 
-    def _plot_patterns(self, patterns, dates, opens, highs, lows, closes):
-        """Overlay key pattern shapes on the price chart using time ranges and levels."""
+    def _plot_patterns(self, patterns, dates, x, opens, highs, lows, closes):
+        """Overlay key pattern shapes on the price chart using time ranges and levels.
+
+        ``dates`` locate each pattern's bars; ``x`` (day numbers) is what gets drawn.
+        """
         if not patterns or not dates:
+            self._pattern_ranges = np.empty((0, 2), dtype=np.int32)
             logging.info(
-                f"No patterns to plot: patterns={len(patterns) if patterns else 0}, dates={len(dates) if dates else 0}"
+                "No patterns to plot: patterns=%d, dates=%d",
+                len(patterns) if patterns else 0,
+                len(dates) if dates else 0,
             )
             return
 
-        logging.info(f"Plotting {len(patterns)} patterns on chart")
-        for i, p in enumerate(patterns[:3]):
-            logging.info(
-                f"Pattern {i}: {p.get('type', 'Unknown')} - {p.get('start_time', 'No start')} to {p.get('end_time', 'No end')}"
-            )
+        # Columns arrive as arrays from _fetch_bars; asarray only guards other
+        # callers, so every per-pattern slice below is a view, not a copy
+        highs = np.asarray(highs)
+        lows = np.asarray(lows)
+        closes = np.asarray(closes)
+
+        # One (start, end) row per pattern, aligned with the listbox; patterns
+        # that are skipped or cannot be drawn keep the whole-chart default
+        last = len(dates) - 1
+        ranges = np.empty((len(patterns), 2), dtype=np.int32)
+        ranges[:] = (0, last)
+        self._pattern_ranges = ranges
+        self._pattern_markers = {}
+        self._pattern_segments = {}
+        self._pattern_bands = []
+        self._pattern_annots = []
+        # Progress logging formats lazily; skip the preview walk when INFO is off
+        logging.info("Plotting %d patterns on chart", len(patterns))
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            for i, p in enumerate(patterns[:3]):
+                logging.info(
+                    "Pattern %d: %s - %s to %s",
+                    i,
+                    p.get("type", "Unknown"),
+                    p.get("start_time", "No start"),
+                    p.get("end_time", "No end"),
+                )
 
-        for pattern in patterns:
+        # Evenly spaced anchor bars for patterns that fail to draw, computed once
+        # so error markers spread across the chart instead of stacking mid-chart
+        fallback_idx = np.linspace(0, len(dates) - 1, len(patterns) + 2).astype(np.intp)[1:-1]
+
+        # Bar times as seconds, converted once for every pattern's date lookup:
+        # a plain list for bisect, or a float64 array for the numba search
+        index_cache = self._pattern_index_cache
+        date_ts = self._chart_date_ts
+        if date_ts is None and len(index_cache) < len(patterns):
+            date_ts = [_to_timestamp(d) or 0.0 for d in dates]
+            # Bars normally arrive in time order; if not, lookups fall back to
+            # a vectorised scan, since a binary search would pick wrong bars
+            self._chart_dates_ordered = all(a <= b for a, b in zip(date_ts, date_ts[1:]))
+            if NUMBA_AVAILABLE or not self._chart_dates_ordered:
+                date_ts = np.asarray(date_ts, dtype=np.float64)
+            # Kept until the next dataset; later analyses on these bars reuse it
+            self._chart_date_ts = date_ts
+
+        # Toggles were snapshotted when they last changed; no Tcl reads per pattern
+        hidden = self._hidden_kinds
+        get_color = self._get_pattern_color
+        for i, pattern in enumerate(patterns):
             if not isinstance(pattern, dict):
                 continue
 
@@ -1117,15 +1725,21 @@ class CryptVaultDesktopCharts:
             if not ptype:
                 continue
 
-            # Respect pattern filter toggles
-            if self._should_skip_pattern(ptype):
-                self._pattern_ranges.append((0, len(dates) - 1))
+            # Respect pattern filter toggles before any parsing or drawing
+            kind = _pattern_kind(ptype)
+            if kind in hidden:
                 continue
 
-            color = self._get_pattern_color(ptype)
+            color = get_color(ptype)
 
             try:
-                s_idx, e_idx = self._get_pattern_indices(pattern, dates)
+                # Filter redraws reuse the lookup; the cache is reset with the patterns
+                cached = index_cache.get(id(pattern))
+                if cached is None:
+                    cached = index_cache[id(pattern)] = self._get_pattern_indices(
+                        pattern, dates, date_ts
+                    )
+                s_idx, e_idx = cached
 
                 # Validate range
                 if (
@@ -1137,9 +1751,14 @@ class CryptVaultDesktopCharts:
                     or e_idx - s_idx < 2
                 ):
                     logging.warning(
-                        f"Invalid range for {ptype}: s_idx={s_idx}, e_idx={e_idx}, dates_len={len(dates)}"
+                        "Invalid range for %s: s_idx=%s, e_idx=%s, dates_len=%d",
+                        ptype,
+                        s_idx,
+                        e_idx,
+                        len(dates),
                     )
-                    self._draw_fallback_marker(ptype, color, dates, closes)
+                    self._draw_fallback_marker(ptype, color, x, closes)
+                    ranges[i] = (max(0, last - 4), last)
                     continue
 
                 # Ensure minimum range
@@ -1147,10 +1766,10 @@ class CryptVaultDesktopCharts:
                     center = (s_idx + e_idx) // 2
                     s_idx = max(0, center - 5)
                     e_idx = min(len(dates) - 1, center + 5)
-                    logging.info(f"Expanded pattern range for {ptype}: {s_idx} to {e_idx}")
+                    logging.info("Expanded pattern range for %s: %d to %d", ptype, s_idx, e_idx)
 
                 # Get data range
-                x_range = dates[s_idx : e_idx + 1]
+                x_range = x[s_idx : e_idx + 1]
                 highs_range = highs[s_idx : e_idx + 1]
                 lows_range = lows[s_idx : e_idx + 1]
 
@@ -1162,53 +1781,82 @@ class CryptVaultDesktopCharts:
                     or len(highs_range) < 2
                     or len(lows_range) < 2
                 ):
-                    logging.warning(f"Insufficient data for {ptype}")
+                    logging.warning("Insufficient data for %s", ptype)
                     continue
 
-                self._pattern_ranges.append((s_idx, e_idx))
+                ranges[i] = (s_idx, e_idx)
                 key_levels = pattern.get("key_levels", {}) or {}
 
-                logging.info(f"Drawing pattern: {ptype} from {s_idx} to {e_idx}")
+                logging.info("Drawing pattern: %s from %d to %d", ptype, s_idx, e_idx)
                 self._dispatch_pattern_drawing(
-                    ptype, x_range, highs_range, lows_range, closes, s_idx, e_idx, key_levels, color
+                    kind,
+                    ptype,
+                    x_range,
+                    highs_range,
+                    lows_range,
+                    closes,
+                    s_idx,
+                    e_idx,
+                    key_levels,
+                    color,
                 )
 
             except Exception as e:
-                logging.error(f"Error processing pattern {ptype}: {e}")
+                logging.error("Error processing pattern %s: %s", ptype, e)
                 try:
-                    x = dates[len(dates) // 2]
-                    y = closes[len(closes) // 2]
-                    self.ax_price.scatter(
-                        x, y, s=100, c=color, marker="X", alpha=0.8, edgecolors="white", linewidth=2
-                    )
-                    self.ax_price.annotate(
+                    fx = x[fallback_idx[i]]
+                    fy = closes[fallback_idx[i]]
+                    self._queue_marker("X", fx, fy, color)
+                    self._annotate_pattern(
                         f"⚠️ {ptype}",
-                        xy=(x, y),
+                        xy=(fx, fy),
                         xytext=(10, 10),
-                        textcoords="offset points",
                         color=color,
                     )
                 except:
                     pass
 
+        self._flush_bands()
+        self._flush_segments()
+        self._flush_markers()
+
     def _on_pattern_select(self, event):
         """Zoom/highlight selected pattern range on the chart."""
-        if not self._pattern_ranges:
+        if not len(self._pattern_ranges):
             return
         try:
             sel = self.pattern_listbox.curselection()
             if not sel:
                 return
+            # Rows and ranges are allocated together, one per pattern, so the
+            # row index is the range offset; anything past them is not a pattern
             idx = sel[0]
-            s_idx, e_idx = self._pattern_ranges[min(idx, len(self._pattern_ranges) - 1)]
-            if self.current_data is None:
+            if idx >= len(self._pattern_ranges):
                 return
-            dates = [p.timestamp for p in self.current_data.data]
-            self.ax_price.set_xlim(dates[max(0, s_idx - 3)], dates[min(len(dates) - 1, e_idx + 3)])
-            self.canvas.draw_idle()
+            s_idx, e_idx = self._pattern_ranges[idx].tolist()
+            # Ranges index the plotted (possibly downsampled) bars, whose day
+            # numbers were computed once at fetch time
+            if not self._chart_series:
+                return
+            x = self._chart_series[1]
+            # The zoom moves every candle, so the cached background cannot be
+            # blitted; re-selecting the current view needs no redraw at all
+            lo, hi = x[max(0, s_idx - 3)], x[min(len(x) - 1, e_idx + 3)]
+            if tuple(self.ax_price.get_xlim()) == (lo, hi):
+                return
+            self.ax_price.set_xlim(lo, hi)
+            # Arrowing through the list moves the limits at once but redraws
+            # only 50 ms after the last selection
+            if self._select_job is not None:
+                self.root.after_cancel(self._select_job)
+            self._select_job = self.root.after(50, self._apply_selection)
         except Exception as e:
-            logging.warning(f"Error selecting pattern: {e}")
-            pass
+            logging.warning("Error selecting pattern: %s", e)
+
+    def _apply_selection(self):
+        """Redraw for the pattern zoom scheduled by _on_pattern_select."""
+        self._select_job = None
+        self.canvas.draw_idle()
 
     def _update_pattern_list(self, patterns):
         """Update the pattern listbox with enhanced pattern display."""
@@ -1219,46 +1867,32 @@ class CryptVaultDesktopCharts:
                 self.pattern_listbox.insert(tk.END, "🔍 No patterns detected")
                 return
 
-            for i, pattern in enumerate(patterns):
-                ptype = pattern.get("type", "Unknown")
-                confidence = pattern.get("confidence", "0%")
-                direction = pattern.get("direction", "neutral")
-
-                # Enhanced pattern symbols with emojis
-                symbol_map = {
-                    "rectangle": "📊",
-                    "triangle": "📐",
-                    "channel": "📈",
-                    "wedge": "📉",
-                    "flag": "🚩",
-                    "pennant": "🎯",
-                    "divergence": "⚡",
-                    "head and shoulders": "👤",
-                    "double top": "⛰️",
-                    "double bottom": "🏔️",
-                }
-
-                symbol = "◆"  # default
-                for key, emoji in symbol_map.items():
-                    if key in ptype.lower():
-                        symbol = emoji
-                        break
+            # Bind per-row lookups once; this loop runs for every analysis
+            get_dot = _DIRECTION_DOTS.get
+            rows = []
+            for pattern in patterns:
+                get = pattern.get
+                ptype = get("type", "Unknown")
+                confidence = get("confidence", "0%")
+                direction = get("direction", "neutral")
+
+                symbol = _list_symbol(ptype)
 
                 # Direction indicators
-                dir_indicator = {"bullish": "🟢", "bearish": "🔴", "neutral": "🟡"}.get(
-                    direction.lower(), "⚪"
-                )
+                dir_indicator = get_dot(direction.lower(), "⚪")
 
                 # Confidence bar
-                conf_num = float(confidence.rstrip("%"))
-                conf_bars = "█" * int(conf_num / 10) + "░" * (10 - int(conf_num / 10))
+                conf_num = round(get("_conf", 0.0) * 100, 1)
+                conf_bars = _CONF_BARS[min(max(int(conf_num / 10), 0), 10)]
 
                 # Enhanced display text
-                display_text = f"{symbol} {ptype:<20} {dir_indicator} [{conf_bars}] {confidence}"
-                self.pattern_listbox.insert(tk.END, display_text)
+                rows.append(f"{symbol} {ptype:<20} {dir_indicator} [{conf_bars}] {confidence}")
+
+            # One Tcl call for all rows
+            self.pattern_listbox.insert(tk.END, *rows)
 
         except Exception as e:
-            logging.warning(f"Error updating pattern list: {e}")
+            logging.warning("Error updating pattern list: %s", e)
             self.pattern_listbox.insert(tk.END, "❌ Error loading patterns")
 
     def export_chart(self):
@@ -1275,17 +1909,40 @@ class CryptVaultDesktopCharts:
 
         if filename:
             try:
-                self.fig.savefig(filename, facecolor="#1e1e1e", edgecolor="none", dpi=300)
-                messagebox.showinfo("Success", f"Chart saved as {filename}")
+                # Snapshot the figure on the UI thread; the 300 dpi render runs on
+                # a detached copy so the Tk canvas stays responsive
+                fig_state = pickle.dumps(self.fig)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save chart: {str(e)}")
+                return
+
+            self.status_var.set(f"Exporting chart to {filename}...")
+            thread = threading.Thread(target=self._do_export, args=(fig_state, filename))
+            thread.daemon = True
+            thread.start()
+
+    def _do_export(self, fig_state, filename):
+        """Render a pickled figure snapshot to disk in a background thread."""
+        try:
+            fig_copy = pickle.loads(fig_state)
+            # Overlays are animated (blitted) on screen; savefig skips those
+            for artist in fig_copy.findobj(lambda a: a.get_animated()):
+                artist.set_animated(False)
+            FigureCanvasAgg(fig_copy)
+            fig_copy.savefig(filename, facecolor="#1e1e1e", edgecolor="none", dpi=300)
+        except Exception as exc:
+            error_msg = f"Failed to save chart: {str(exc)}"
+            self._post_to_ui(lambda: messagebox.showerror("Error", error_msg))
+            return
+
+        self._post_to_ui(lambda: messagebox.showinfo("Success", f"Chart saved as {filename}"))
 
     def _show_error(self, message):
         """Show enhanced error message with better formatting."""
         try:
             # Clear chart and show error state
             if hasattr(self, "ax_price") and self.ax_price:
-                self.ax_price.clear()
+                self._clear_chart_artists()
                 self.ax_price.text(
                     0.5,
                     0.5,
@@ -1297,8 +1954,7 @@ class CryptVaultDesktopCharts:
                     fontsize=14,
                     fontweight="bold",
                 )
-                self.ax_price.set_facecolor("#0f1419")
-                self.canvas.draw()
+                self.canvas.draw_idle()
 
             # Also show messagebox
             messagebox.showerror(
@@ -1306,7 +1962,7 @@ class CryptVaultDesktopCharts:
                 f"An error occurred:\n\n{message}\n\nPlease try again or check your internet connection.",
             )
         except Exception as e:
-            logging.error(f"Error showing error message: {e}")
+            logging.error("Error showing error message: %s", e)
             messagebox.showerror("Error", message)  # Fallback}")
 
     def run(self):
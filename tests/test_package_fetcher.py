@@ -0,0 +1,55 @@
+"""
+Package fetcher tests — the incremental on-disk bar store.
+
+No network: the provider call is replaced by a synthetic series so only the
+store's fetch-the-tail-and-merge logic is exercised.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from cryptvault.data.models import PriceDataFrame, PricePoint
+from cryptvault.data.models.package_fetcher import PackageDataFetcher
+
+
+@pytest.fixture
+def provider():
+    """Daily bars ending today; records the ``days`` of every provider call."""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    calls = []
+
+    def fetch(symbol, days, interval, close=100.0):
+        calls.append(days)
+        points = [
+            PricePoint(today - timedelta(days=d), close, close + 1, close - 1, close, 10.0)
+            for d in range(days - 1, -1, -1)
+        ]
+        return PriceDataFrame(points, symbol=f"{symbol}-USD", timeframe=interval)
+
+    fetch.calls = calls
+    return fetch
+
+
+def test_second_fetch_only_requests_the_tail(tmp_path, provider, monkeypatch):
+    fetcher = PackageDataFetcher(cache_dir=str(tmp_path))
+    monkeypatch.setattr(fetcher, "_fetch_source", provider)
+
+    first = fetcher.fetch_historical_data("BTC", 30, "1d")
+    reopened = PackageDataFetcher(cache_dir=str(tmp_path))
+    monkeypatch.setattr(reopened, "_fetch_source", lambda s, d, i: provider(s, d, i, close=200.0))
+    again = reopened.fetch_historical_data("BTC", 30, "1d")
+
+    assert provider.calls == [30, 1], "only the trailing day is refetched"
+    assert len(again) == len(first) and again.symbol == "BTC-USD"
+    assert again[-1].close == 200.0, "the trailing candle is replaced"
+    assert again[0].close == 100.0, "older bars come from the store"
+
+
+def test_stored_bars_are_served_when_refresh_fails(tmp_path, provider, monkeypatch):
+    fetcher = PackageDataFetcher(cache_dir=str(tmp_path))
+    monkeypatch.setattr(fetcher, "_fetch_source", provider)
+    fetcher.fetch_historical_data("ETH", 10, "1d")
+
+    monkeypatch.setattr(fetcher, "_fetch_source", lambda *a: None)
+    assert len(fetcher.fetch_historical_data("ETH", 10, "1d")) == 10
@@ -0,0 +1,149 @@
+"""
+Matplotlib desktop chart tests — the pure helpers behind the Tk chart window.
+
+No display is needed: module-level functions and a few methods are exercised
+directly, the Tk application itself is never constructed.
+"""
+
+from datetime import datetime, timedelta
+from unittest import mock
+
+import matplotlib.dates as mdates
+import numpy as np
+import pytest
+
+from cryptvault.visualization import desktop_charts
+
+
+@pytest.fixture
+def bars():
+    n = 1234
+    dates = [datetime(2024, 1, 1) + timedelta(hours=i) for i in range(n)]
+    close = 100 + np.cumsum(np.sin(np.arange(n) / 7.0))
+    opens = np.r_[close[0], close[:-1]]
+    return (
+        dates,
+        opens.tolist(),
+        (np.maximum(opens, close) + 1).tolist(),
+        (np.minimum(opens, close) - 1).tolist(),
+        close.tolist(),
+        np.full(n, 10.0).tolist(),
+    )
+
+
+def test_short_series_is_drawn_bar_for_bar(bars):
+    short = tuple(col[:100] for col in bars)
+    assert desktop_charts._downsample_ohlc(*short) == short
+
+
+def test_downsample_preserves_ohlc_extremes_and_latest_bar(bars):
+    dates, opens, highs, lows, closes, volumes = bars
+    d, o, h, l, c, v = desktop_charts._downsample_ohlc(*bars, max_bars=500)
+
+    assert len(c) <= 500
+    assert len({len(d), len(o), len(h), len(l), len(c), len(v)}) == 1
+    assert d[0] == dates[0] and o[0] == opens[0]
+    assert c[-1] == closes[-1], "the most recent close must survive bucketing"
+    assert max(h) == max(highs) and min(l) == min(lows)
+    assert sum(v) == pytest.approx(sum(volumes))
+
+
+def test_head_and_shoulders_points():
+    highs = np.array([1.0, 3.0, 2.0, 5.0, 1.5, 4.0, 0.5])
+    left, head, right, left_trough, right_trough = desktop_charts._find_hns_points(highs)
+    assert (left, head, right) == (1, 3, 5)
+    assert (left_trough, right_trough) == (2, 4), "neckline runs between shoulders and head"
+    assert desktop_charts._find_hns_points(np.array([5.0, 4.0, 3.0, 2.0, 1.0]))[0] == -1
+
+
+def test_find_date_index_picks_nearest_bar():
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(5)]
+    date_ts = np.array([d.timestamp() for d in dates])
+    find = desktop_charts.CryptVaultDesktopCharts._find_date_index
+    assert find(None, dates[2] + timedelta(hours=11), date_ts) == 2
+    assert find(None, dates[2] + timedelta(hours=13), date_ts) == 3
+    assert find(None, dates[0] - timedelta(days=3), date_ts) == 0
+    assert find(None, dates[-1] + timedelta(days=3), date_ts) == 4
+    assert find(None, "not a date", date_ts) is None
+
+
+def test_find_date_index_scans_unordered_bars():
+    dates = [datetime(2024, 1, 1) + timedelta(days=i) for i in (3, 0, 4, 1, 2)]
+    date_ts = np.array([d.timestamp() for d in dates])
+    find = desktop_charts.CryptVaultDesktopCharts._find_date_index
+    assert find(None, datetime(2024, 1, 2, 1), date_ts, ordered=False) == 3
+    assert find(None, datetime(2024, 1, 9), date_ts, ordered=False) == 2
+
+
+@pytest.mark.parametrize(
+    "text, fmt",
+    [
+        ("2024-03-05", "%Y-%m-%d"),
+        ("2024-03-05 14:30:00", "%Y-%m-%d %H:%M:%S"),
+        ("2024-03-05T14:30:00Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2024-03-05 14:30:00.125", "%Y-%m-%d %H:%M:%S.%f"),
+    ],
+)
+def test_fast_parse_matches_strptime(text, fmt):
+    assert desktop_charts._fast_parse_dt(text) == datetime.strptime(text, fmt)
+
+
+def test_fast_parse_rejects_unknown_formats():
+    assert desktop_charts._fast_parse_dt("05/03/2024") is None
+    assert desktop_charts._fast_parse_dt("2024-02-30") is None
+
+
+@pytest.mark.parametrize(
+    "ptype, kind",
+    [
+        ("Expanding Triangle", "expanding_triangle"),
+        ("Symmetrical Triangle", "triangle"),
+        ("Bearish Pennant", "flag"),
+        ("Head and Shoulders", "head_shoulders"),
+        ("Head and Shoulder", "head_shoulders"),
+        ("Inverse Head and Shoulder", "default"),
+        ("Inverse Head and Shoulders", "default"),
+        ("Bullish Divergence", "divergence"),
+        ("Gartley", "default"),
+    ],
+)
+def test_pattern_kind(ptype, kind):
+    assert desktop_charts._pattern_kind(ptype) == kind
+
+
+def test_epoch_from_string_is_memoised():
+    text = "2024-03-05 14:30:00"
+    assert desktop_charts._epoch_from_string(text) == datetime(2024, 3, 5, 14, 30).timestamp()
+    hits = desktop_charts._epoch_from_string.cache_info().hits
+    desktop_charts._epoch_from_string(text)
+    assert desktop_charts._epoch_from_string.cache_info().hits == hits + 1
+    assert desktop_charts._epoch_from_string("garbage") is None
+
+
+def test_same_bars_after_error_screen_redraw_the_chart(bars, monkeypatch):
+    """An error screen must not be reused as the background for a retry on the same bars."""
+    monkeypatch.setattr(desktop_charts, "messagebox", mock.MagicMock())
+    app = desktop_charts.CryptVaultDesktopCharts.__new__(desktop_charts.CryptVaultDesktopCharts)
+    for name in (
+        "ax_price", "ax_vol", "canvas", "status_var", "pattern_listbox", "_wick_lines",
+        "_candle_bodies", "_volume_bars", "_price_line", "_current_line", "_current_label",
+    ):
+        setattr(app, name, mock.MagicMock())
+    app._data_artists = ()
+    app._current_interval = "1d"
+    app._display_patterns = []
+    dates, *columns = desktop_charts._downsample_ohlc(*bars, max_bars=100)
+    series = (dates, mdates.date2num(dates), *(np.asarray(c, dtype=np.float32) for c in columns))
+    app._chart_series = series[:6]
+    app._last_bg_sig = app._background_signature("BTC", series)
+
+    # Analysis failed while the fetch returned the cached bars
+    app._show_error("Analysis failed: unknown error")
+    app._bg = object()  # _on_draw captured the error screen
+    app._refresh_overlays = mock.MagicMock()
+
+    app._update_chart({"success": True, "patterns": []}, "BTC", None, series)
+
+    app._refresh_overlays.assert_not_called()
+    assert app._chart_series[0] is dates, "the bars are charted again"
+    assert app._last_bg_sig == app._background_signature("BTC", series)